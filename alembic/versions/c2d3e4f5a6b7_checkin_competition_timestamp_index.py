@@ -0,0 +1,34 @@
+"""checkins: composite (competition_id, timestamp) index.
+
+Check-in lists and the CSV export filter on competition plus a
+timestamp range and sort newest first. Guarded create so it is a no-op
+on databases bootstrapped through create_all().
+
+Revision ID: c2d3e4f5a6b7
+Revises: b1c2d3e4f5a6
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+revision: str = "c2d3e4f5a6b7"
+down_revision: Union[str, None] = "b1c2d3e4f5a6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    insp = inspect(op.get_bind())
+    if "checkins" not in set(insp.get_table_names()):
+        return
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_checkins_competition_timestamp ON checkins (competition_id, timestamp)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_checkins_competition_timestamp")
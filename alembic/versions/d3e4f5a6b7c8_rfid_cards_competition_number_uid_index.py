@@ -0,0 +1,34 @@
+"""rfid_cards: composite (competition_id, number, uid) index.
+
+The card list filters on competition and orders by number then uid.
+Guarded create so it is a no-op on databases bootstrapped through
+create_all().
+
+Revision ID: d3e4f5a6b7c8
+Revises: c2d3e4f5a6b7
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+revision: str = "d3e4f5a6b7c8"
+down_revision: Union[str, None] = "c2d3e4f5a6b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    insp = inspect(op.get_bind())
+    if "rfid_cards" not in set(insp.get_table_names()):
+        return
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_rfid_cards_competition_number_uid ON rfid_cards (competition_id, number, uid)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_rfid_cards_competition_number_uid")
@@ -36,6 +36,7 @@ from .utils.competition import (
     get_user_competitions,
 )
 from .utils.csrf import csrf_input, get_csrf_token, protect_request
+from .utils.json_provider import OrjsonProvider
 from .utils.perms import inject_perms
 
 
@@ -44,6 +45,7 @@ def create_app(config_overrides: dict | None = None) -> Flask:
     app.config.from_object("config.Config")
     if config_overrides:
         app.config.update(config_overrides)
+    app.json = OrjsonProvider(app)
     app.jinja_env.filters["local_dt"] = to_datetime_local
 
     # Pretty-print a dict/list as JSON for human display, preserving
@@ -85,6 +87,24 @@ def create_app(config_overrides: dict | None = None) -> Flask:
             db_path = os.path.join(app.instance_path, "app.db")
         app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{db_path}"
 
+    # Explicit per-process pool so ingest bursts reuse connections (and the
+    # connect-time PRAGMAs) instead of reconnecting. In-memory SQLite uses
+    # Flask-SQLAlchemy's StaticPool, which takes no sizing arguments.
+    # pool_pre_ping only matters for server databases that drop idle
+    # connections.
+    db_uri = app.config["SQLALCHEMY_DATABASE_URI"]
+    if db_uri not in ("sqlite://", "sqlite:///:memory:"):
+        engine_options = {
+            "pool_size": app.config["DB_POOL_SIZE"],
+            "max_overflow": app.config["DB_MAX_OVERFLOW"],
+        }
+        if not db_uri.startswith("sqlite"):
+            engine_options.update(pool_pre_ping=True, pool_recycle=1800)
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+            **engine_options,
+            **(app.config.get("SQLALCHEMY_ENGINE_OPTIONS") or {}),
+        }
+
     app.register_blueprint(auth_api_bp)
     app.register_blueprint(checkpoints_api_bp)
     app.register_blueprint(groups_api_bp)
@@ -306,6 +326,9 @@ def create_app(config_overrides: dict | None = None) -> Flask:
 
     @app.before_request
     def _set_competition_on_g():
+        # g outlives a request when the caller already holds an app context
+        # (tests, api_json's nested client); drop the memoized role set.
+        g.pop("_role_set_cache", None)
         g.current_competition = get_current_competition()
 
     @app.cli.command("sheets-worker")
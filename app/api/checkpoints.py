@@ -12,6 +12,7 @@ from app.extensions import db
 from app.models import Checkpoint, LoRaDevice, Path, PathStop, TimedSegment
 from app.utils.audit import record_audit_event
 from app.utils.competition import require_current_competition_id
+from app.utils.listing_cache import invalidate_listing
 from app.utils.rest_auth import json_login_required, json_roles_required
 from app.utils.validators import validate_finite_float, validate_text
 
@@ -173,6 +174,16 @@ def checkpoint_list():
     comp_id = require_current_competition_id()
     if not comp_id:
         return jsonify({"error": "no_competition"}), 400
+    if request.args.get("fields") == "summary":
+        # Pickers only need id/name; skip hydrating full rows and the
+        # per-checkpoint judge/path lookups.
+        rows = (
+            _checkpoint_query(comp_id)
+            .with_entities(Checkpoint.id, Checkpoint.name)
+            .order_by(Checkpoint.name.asc())
+            .all()
+        )
+        return json_ok({"checkpoints": [{"id": row.id, "name": row.name} for row in rows]})
     cps = (
         _checkpoint_query(comp_id)
         .options(
@@ -257,6 +268,7 @@ def checkpoint_create():
         details=_checkpoint_snapshot(cp),
     )
     db.session.commit()
+    invalidate_listing(comp_id)
     return json_ok({"ok": True, "checkpoint": _serialize_checkpoint(cp)}, status=201)
 
 
@@ -412,6 +424,7 @@ def _update_checkpoint(checkpoint_id: int, partial: bool):
         details={"before": before, "after": _checkpoint_snapshot(cp)},
     )
     db.session.commit()
+    invalidate_listing(comp_id)
     return json_ok({"ok": True, "checkpoint": _serialize_checkpoint(cp)})
 
 
@@ -450,6 +463,7 @@ def checkpoint_delete(checkpoint_id: int):
     )
     db.session.delete(cp)
     db.session.commit()
+    invalidate_listing(comp_id)
     return json_ok({"ok": True})
 
 
@@ -565,6 +579,7 @@ def checkpoint_import():
         updated += 0 if is_new else 1
 
     db.session.commit()
+    invalidate_listing(comp_id)
 
     return json_ok(
         {
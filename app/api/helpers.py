@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from flask import jsonify
+import gzip
+
+from flask import jsonify, request
 from werkzeug.exceptions import BadRequest
 
 
@@ -20,6 +22,27 @@ def json_error(key: str, status: int, detail: str | None = None):
     return response
 
 
+def gzip_if_accepted(response, min_size: int = 1024):
+    """Gzip a 200 response body when the client accepts it.
+
+    Call after make_conditional so a 304 skips the work. The ETag is made
+    weak: both encodings carry the same JSON, and If-None-Match is compared
+    weakly, so a revalidation with either form still gets a 304.
+    """
+    if response.status_code != 200 or response.direct_passthrough or "Content-Encoding" in response.headers:
+        return response
+    response.vary.add("Accept-Encoding")
+    body = response.get_data()
+    if len(body) < min_size or "gzip" not in request.accept_encodings:
+        return response
+    response.set_data(gzip.compress(body, compresslevel=5))
+    response.headers["Content-Encoding"] = "gzip"
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
 def parse_int(value, name: str) -> int:
     try:
         return int(value)
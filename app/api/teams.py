@@ -7,7 +7,7 @@ from collections.abc import Iterable
 from flask import Blueprint, current_app, jsonify, request
 from flask_babel import gettext as _
 from flask_login import current_user
-from sqlalchemy import or_
+from sqlalchemy import or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import joinedload
 
@@ -16,6 +16,7 @@ from app.extensions import db
 from app.models import CheckpointGroup, Team, TeamGroup, TeamMember
 from app.utils.audit import record_audit_event
 from app.utils.competition import get_current_competition_role, require_current_competition_id
+from app.utils.listing_cache import invalidate_listing
 from app.utils.rest_auth import json_login_required, json_roles_required
 from app.utils.sheets_sync import sync_all_checkpoint_tabs
 from app.utils.validators import validate_finite_float, validate_text
@@ -126,7 +127,14 @@ def _parse_group_ids(raw_ids: Iterable) -> list[int]:
     return ids
 
 
-def _apply_group_assignment(team: Team, selected_group_id: int | None) -> tuple[bool, str | None]:
+def _apply_group_assignment(
+    team: Team, selected_group_id: int | None, *, group_checked: bool = False
+) -> tuple[bool, str | None]:
+    """Make selected_group_id the team's only (active) group.
+
+    group_checked=True skips the group lookup when the caller already
+    proved the group exists in the team's competition.
+    """
     existing_links = {tg.group_id: tg for tg in list(team.group_assignments)}
 
     if selected_group_id is None:
@@ -141,11 +149,12 @@ def _apply_group_assignment(team: Team, selected_group_id: int | None) -> tuple[
     except Exception:
         return False, "group_id must be a positive integer"
 
-    group = db.session.get(CheckpointGroup, selected_group_id)
-    if not group:
-        return False, "Invalid group"
-    if group.competition_id != team.competition_id:
-        return False, "Invalid group for this competition"
+    if not group_checked:
+        group = db.session.get(CheckpointGroup, selected_group_id)
+        if not group:
+            return False, "Invalid group"
+        if group.competition_id != team.competition_id:
+            return False, "Invalid group for this competition"
 
     to_remove = [gid for gid in existing_links if gid != selected_group_id]
     if to_remove:
@@ -311,6 +320,7 @@ def team_create():
         )
         _dispatch_sync_all(comp_id)
         db.session.commit()
+        invalidate_listing(comp_id)
     except IntegrityError:
         db.session.rollback()
         return jsonify({"error": "validation_error", "detail": _("Team number must be a positive integer.")}), 400
@@ -459,6 +469,7 @@ def _update_team(team_id: int, partial: bool):
         )
         _dispatch_sync_all(comp_id)
         db.session.commit()
+        invalidate_listing(comp_id)
     except IntegrityError:
         db.session.rollback()
         return jsonify({"error": "validation_error", "detail": _("Team number must be a positive integer.")}), 400
@@ -511,6 +522,7 @@ def team_delete(team_id: int):
     # presses the sync button.
     _dispatch_sync_all(comp_id)
     db.session.commit()
+    invalidate_listing(comp_id)
     return json_ok({"ok": True})
 
 
@@ -527,11 +539,21 @@ def team_active_group(team_id: int):
     except Exception:
         return jsonify({"error": "validation_error", "detail": "group_id must be integer"}), 400
 
-    team = _team_query(comp_id).filter(Team.id == team_id).first()
+    if group_id <= 0:
+        return jsonify({"error": "validation_error", "detail": "group_id must be a positive integer"}), 400
+
+    # The team comes with its current assignments, which the swap below
+    # walks; the group only needs its competition, so two round trips total.
+    team = _team_query(comp_id).filter(Team.id == team_id).options(joinedload(Team.group_assignments)).first()
     if not team:
         return jsonify({"error": "not_found"}), 404
+    group_comp_id = db.session.scalar(select(CheckpointGroup.competition_id).where(CheckpointGroup.id == group_id))
+    if group_comp_id is None:
+        return jsonify({"error": "validation_error", "detail": "Invalid group"}), 400
+    if group_comp_id != comp_id:
+        return jsonify({"error": "validation_error", "detail": "Invalid group for this competition"}), 400
 
-    ok, err = _apply_group_assignment(team, group_id)
+    ok, err = _apply_group_assignment(team, group_id, group_checked=True)
     if not ok:
         return jsonify({"error": "validation_error", "detail": err}), 400
 
@@ -549,6 +571,7 @@ def team_active_group(team_id: int):
     # sheet tabs; refresh them like any other roster change.
     _dispatch_sync_all(comp_id)
     db.session.commit()
+    invalidate_listing(comp_id)
     return json_ok({"ok": True})
 
 
@@ -704,4 +727,5 @@ def team_randomize_numbers():
         # Numbers are exactly what the sheet team columns display.
         _dispatch_sync_all(comp_id)
         db.session.commit()
+        invalidate_listing(comp_id)
     return json_ok({"ok": True, "assigned_total": assigned_total, "results": results})
@@ -33,6 +33,7 @@ from app.models import (
     User,
 )
 from app.utils.competition import require_current_competition_id
+from app.utils.listing_cache import invalidate_listing
 from app.utils.paths import resolve_route_ids
 from app.utils.rest_auth import json_roles_required
 from app.utils.scoring_backfill import convert_legacy_scoring
@@ -1198,17 +1199,17 @@ def _apply_merge(data: dict, comp: Competition, resolutions: dict) -> dict:
                 added["group_checkpoint_links"] += 1
         db.session.flush()
 
-    # Check-ins (add only new ones, matched by team+checkpoint)
+    # Check-ins (add only new ones, matched by team+checkpoint). Existing
+    # pairs are read once as bare tuples instead of one query per row.
+    existing_checkins = set(
+        db.session.query(Checkin.team_id, Checkin.checkpoint_id).filter_by(competition_id=comp.id).all()
+    )
     for ci_data in data.get("checkins", []):
         team = team_map.get(ci_data.get("team_name"))
         cp = cp_map.get(ci_data.get("checkpoint_name"))
         if team and cp:
-            existing = Checkin.query.filter_by(
-                team_id=team.id,
-                checkpoint_id=cp.id,
-                competition_id=comp.id,
-            ).first()
-            if not existing:
+            if (team.id, cp.id) not in existing_checkins:
+                existing_checkins.add((team.id, cp.id))
                 ts = utcnow_naive()
                 if ci_data.get("timestamp"):
                     try:
@@ -1511,6 +1512,7 @@ def import_competition():
 
     comp, warnings = _import_competition_from_json(data)
     db.session.commit()
+    invalidate_listing(comp.id)
 
     return json_ok(
         {
@@ -1575,6 +1577,7 @@ def merge_competition(comp_id: int):
 
     summary = _apply_merge(data, comp, resolutions)
     db.session.commit()
+    invalidate_listing(comp.id)
 
     return json_ok(
         {
@@ -41,7 +41,7 @@ def _accept_pending_invites(user: User) -> None:
         return
     now = utcnow_naive()
     invites = CompetitionInvite.query.filter(
-        CompetitionInvite.invited_email.ilike(user.email),
+        CompetitionInvite.invited_email == user.email.lower(),
         CompetitionInvite.used_at.is_(None),
         CompetitionInvite.expires_at > now,
     ).all()
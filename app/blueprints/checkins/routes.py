@@ -10,6 +10,7 @@ from flask_login import current_user, login_required
 from app.models import Checkpoint, CheckpointGroup, JudgeCheckpoint
 from app.utils.competition import get_current_competition_id, get_current_competition_role
 from app.utils.frontend_api import api_json, api_request
+from app.utils.listing_cache import get_cached_listing, store_listing
 from app.utils.live_arrivals import build_live_arrivals
 from app.utils.perms import roles_required
 from app.utils.time import DEFAULT_TZ_NAME, format_datetime_input_local, get_timezone, utcnow_naive
@@ -20,20 +21,27 @@ checkins_bp = Blueprint("checkins", __name__, template_folder="../../templates")
 DEFAULT_TIMEZONE_NAME = DEFAULT_TZ_NAME
 
 
-def _fetch_teams():
-    resp, payload = api_json("GET", "/api/teams", params={"sort": "name_asc"})
+def _fetch_listing(path: str, key: str, error: str, params: dict | None = None, *, cached: bool) -> list[dict]:
+    competition_id = get_current_competition_id()
+    hit = get_cached_listing(competition_id, key) if cached else None
+    if hit is not None:
+        return hit
+
+    resp, payload = api_json("GET", path, params=params)
     if resp.status_code != 200:
-        flash(_("Could not load teams."), "warning")
+        flash(error, "warning")
         return []
-    return payload.get("teams", [])
+    items = payload.get(key, [])
+    store_listing(competition_id, key, items)
+    return items
 
 
-def _fetch_checkpoints():
-    resp, payload = api_json("GET", "/api/checkpoints")
-    if resp.status_code != 200:
-        flash(_("Could not load checkpoints."), "warning")
-        return []
-    return payload.get("checkpoints", [])
+def _fetch_teams(*, cached: bool = False):
+    return _fetch_listing("/api/teams", "teams", _("Could not load teams."), params={"sort": "name_asc"}, cached=cached)
+
+
+def _fetch_checkpoints(*, cached: bool = False):
+    return _fetch_listing("/api/checkpoints", "checkpoints", _("Could not load checkpoints."), cached=cached)
 
 
 def _fetch_assigned_checkpoints():
@@ -52,7 +60,7 @@ def _fetch_assigned_checkpoints():
     return [jc.checkpoint for jc in assigned if jc.checkpoint]
 
 
-def _fetch_checkpoints_for_user(include_checkpoint_id: int | None = None):
+def _fetch_checkpoints_for_user(include_checkpoint_id: int | None = None, *, cached: bool = False):
     role = get_current_competition_role()
     if role == "judge":
         checkpoints = _fetch_assigned_checkpoints()
@@ -61,7 +69,7 @@ def _fetch_checkpoints_for_user(include_checkpoint_id: int | None = None):
             if extra:
                 checkpoints.append(extra)
         return checkpoints
-    return _fetch_checkpoints()
+    return _fetch_checkpoints(cached=cached)
 
 
 def _parse_timestamp_from_form(fallback: datetime | None = None) -> datetime:
@@ -146,8 +154,9 @@ def list_checkins():
             "has_next": False,
         }
 
-    teams = _fetch_teams()
-    checkpoints = _fetch_checkpoints_for_user(include_checkpoint_id=checkpoint_id)
+    # Filter dropdowns only; the add/edit forms always fetch fresh lists.
+    teams = _fetch_teams(cached=True)
+    checkpoints = _fetch_checkpoints_for_user(include_checkpoint_id=checkpoint_id, cached=True)
 
     return render_template(
         "view_checkins.html",
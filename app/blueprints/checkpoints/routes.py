@@ -40,6 +40,11 @@ def _fetch_paths():
     return payload.get("paths", [])
 
 
+def _paths_for_ids(paths_by_id: dict, path_ids: list[int]) -> list[dict]:
+    """Path summaries for the submitted ids, for redisplaying a failed form."""
+    return [paths_by_id.get(gid) or {"id": gid, "name": "Unknown"} for gid in path_ids]
+
+
 def _fetch_devices():
     resp, payload = api_json("GET", "/api/devices")
     if resp.status_code != 200:
@@ -247,7 +252,7 @@ def add_checkpoint():
                 "add_checkpoint.html",
                 paths=paths,
                 devices=devices,
-                selected_path_ids=form_data["path_ids"] if form_data else [],
+                selected_path_ids=frozenset(form_data["path_ids"] if form_data else ()),
                 selected_device_id=(form_data["lora_device_id"] if form_data else "") or "",
             )
         if not form_data["name"]:
@@ -256,7 +261,7 @@ def add_checkpoint():
                 "add_checkpoint.html",
                 paths=paths,
                 devices=devices,
-                selected_path_ids=form_data["path_ids"],
+                selected_path_ids=frozenset(form_data["path_ids"]),
                 selected_device_id=form_data["lora_device_id"] or "",
             )
 
@@ -271,7 +276,7 @@ def add_checkpoint():
         "add_checkpoint.html",
         paths=paths,
         devices=devices,
-        selected_path_ids=form_data["path_ids"] if form_data else [],
+        selected_path_ids=frozenset(form_data["path_ids"] if form_data else ()),
         selected_device_id=form_data["lora_device_id"] if form_data else "",
     )
 
@@ -288,6 +293,7 @@ def edit_checkpoint(cp_id: int):
     if not isinstance(checkpoint, dict):
         checkpoint = {}
     paths = _fetch_paths()
+    paths_by_id = {p.get("id"): p for p in paths}
     devices = _fetch_devices()
 
     existing_path_ids = [p.get("id") for p in checkpoint.get("paths", []) if isinstance(p, dict)]
@@ -298,32 +304,26 @@ def edit_checkpoint(cp_id: int):
         if form_error:
             flash(form_error, "warning")
             checkpoint.update({k: v for k, v in form_data.items() if k != "path_ids"})
-            checkpoint["paths"] = [
-                next((p for p in paths if p.get("id") == gid), {"id": gid, "name": "Unknown"})
-                for gid in form_data["path_ids"]
-            ]
+            checkpoint["paths"] = _paths_for_ids(paths_by_id, form_data["path_ids"])
             return render_template(
                 "checkpoint_edit.html",
                 cp=checkpoint,
                 paths=paths,
                 devices=devices,
-                selected_path_ids=form_data["path_ids"],
+                selected_path_ids=frozenset(form_data["path_ids"]),
                 selected_device_id=form_data["lora_device_id"] or "",
             )
 
         if not form_data["name"]:
             flash(_("Name is required."), "warning")
             checkpoint.update({k: v for k, v in form_data.items() if k != "path_ids"})
-            checkpoint["paths"] = [
-                next((p for p in paths if p.get("id") == gid), {"id": gid, "name": "Unknown"})
-                for gid in form_data["path_ids"]
-            ]
+            checkpoint["paths"] = _paths_for_ids(paths_by_id, form_data["path_ids"])
             return render_template(
                 "checkpoint_edit.html",
                 cp=checkpoint,
                 paths=paths,
                 devices=devices,
-                selected_path_ids=form_data["path_ids"],
+                selected_path_ids=frozenset(form_data["path_ids"]),
                 selected_device_id=form_data["lora_device_id"] or "",
             )
 
@@ -334,10 +334,7 @@ def edit_checkpoint(cp_id: int):
 
         flash(_checkpoint_error_message(payload, _("Could not update checkpoint.")), "warning")
         checkpoint.update({k: v for k, v in form_data.items() if k != "path_ids"})
-        checkpoint["paths"] = [
-            next((p for p in paths if p.get("id") == gid), {"id": gid, "name": "Unknown"})
-            for gid in form_data["path_ids"]
-        ]
+        checkpoint["paths"] = _paths_for_ids(paths_by_id, form_data["path_ids"])
         selected_ids = form_data["path_ids"]
         selected_device_id = form_data["lora_device_id"] or ""
     else:
@@ -352,7 +349,7 @@ def edit_checkpoint(cp_id: int):
         cp=checkpoint,
         paths=paths,
         devices=devices,
-        selected_path_ids=selected_ids,
+        selected_path_ids=frozenset(selected_ids),
         selected_device_id=selected_device_id,
     )
 
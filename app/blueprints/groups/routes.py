@@ -1,7 +1,7 @@
 # app/blueprints/groups/routes.py
 from __future__ import annotations
 
-from flask import Blueprint, flash, redirect, render_template, request, url_for
+from flask import Blueprint, flash, make_response, redirect, render_template, request, url_for
 from flask_babel import gettext as _
 
 from app.utils.frontend_api import api_json
@@ -45,7 +45,14 @@ def list_groups():
         groups = []
     else:
         groups = payload.get("groups", [])
-    return render_template("groups_list.html", groups=groups)
+    response = make_response(render_template("groups_list.html", groups=groups))
+    # Judges refresh this page a lot and it rarely changes. The ETag hashes
+    # the rendered body, so flashes and per-user chrome never match a stale
+    # copy; no-cache (rather than a max-age) keeps the redirect after an
+    # add/edit from showing the old list.
+    response.add_etag()
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response.make_conditional(request)
 
 
 @groups_bp.route("/add", methods=["GET", "POST"])
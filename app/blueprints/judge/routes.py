@@ -183,7 +183,7 @@ def _bulk_grid_data(comp_id: int, checkpoint: Checkpoint) -> list[dict]:
             ScoreEntry.checkpoint_id == checkpoint.id,
         )
         .order_by(ScoreEntry.created_at.desc())
-        .all()
+        .yield_per(500)
     ):
         latest_entry.setdefault(entry.team_id, entry)
 
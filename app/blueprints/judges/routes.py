@@ -3,6 +3,8 @@ from __future__ import annotations
 
 from flask import Blueprint, flash, redirect, render_template, request, url_for
 from flask_babel import gettext as _
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from app.extensions import db
 from app.models import Checkpoint, CompetitionMember, JudgeCheckpoint, User
@@ -27,24 +29,6 @@ def assign_checkpoints():
     if redirect_resp:
         return redirect_resp
 
-    members = (
-        db.session.query(User, CompetitionMember)
-        .join(CompetitionMember, CompetitionMember.user_id == User.id)
-        .filter(
-            CompetitionMember.competition_id == comp_id,
-            CompetitionMember.active.is_(True),
-            CompetitionMember.role.in_(["judge", "admin"]),
-        )
-        .order_by(User.username.asc())
-        .all()
-    )
-    judges = [{"id": u.id, "username": u.username, "role": m.role} for u, m in members]
-    checkpoints = (
-        Checkpoint.query.filter(Checkpoint.competition_id == comp_id)
-        .order_by(Checkpoint.position.asc().nulls_last(), Checkpoint.name.asc())
-        .all()
-    )
-
     if request.method == "POST":
         judge_id = request.form.get("judge_id", type=int)
         selected_ids = request.form.getlist("checkpoint_ids")
@@ -68,7 +52,18 @@ def assign_checkpoints():
         except Exception:
             selected_ids = []
 
-        allowed_ids = {c.id for c in checkpoints}
+        # Only the submitted ids need checking; the judge and checkpoint
+        # lists below are for rendering the form and are skipped on POST.
+        allowed_ids: set[int] = set()
+        if selected_ids:
+            allowed_ids = set(
+                db.session.scalars(
+                    select(Checkpoint.id).where(
+                        Checkpoint.competition_id == comp_id,
+                        Checkpoint.id.in_(selected_ids),
+                    )
+                )
+            )
         selected_ids = [cid for cid in selected_ids if cid in allowed_ids]
 
         if default_id and default_id not in selected_ids:
@@ -78,41 +73,60 @@ def assign_checkpoints():
         # judge's assignments here can't wipe their assignments in another
         # competition. Previously the query was unscoped and the delete
         # loop nuked unrelated rows.
-        existing = JudgeCheckpoint.query.filter(
-            JudgeCheckpoint.user_id == judge_id,
-            JudgeCheckpoint.competition_id == comp_id,
-        ).all()
-        existing_ids = {jc.checkpoint_id for jc in existing}
-        selected_set = set(selected_ids)
-
-        for jc in existing:
-            if jc.checkpoint_id not in selected_set:
-                db.session.delete(jc)
-
-        for cid in selected_ids:
-            if cid not in existing_ids:
-                db.session.add(JudgeCheckpoint(user_id=judge_id, checkpoint_id=cid, competition_id=comp_id))
-
-        if selected_ids and not default_id:
-            default_id = selected_ids[0]
+        #
+        # Three set-based statements regardless of how many rows change:
+        # drop unselected, insert missing (existing pairs hit
+        # uq_judge_checkpoint and are skipped), then flip is_default.
+        scope = (JudgeCheckpoint.user_id == judge_id, JudgeCheckpoint.competition_id == comp_id)
+        JudgeCheckpoint.query.filter(*scope, JudgeCheckpoint.checkpoint_id.not_in(selected_ids)).delete(
+            synchronize_session=False
+        )
 
         if selected_ids:
-            (
-                JudgeCheckpoint.query.filter(
-                    JudgeCheckpoint.user_id == judge_id,
-                    JudgeCheckpoint.competition_id == comp_id,
-                ).update({JudgeCheckpoint.is_default: False}, synchronize_session=False)
+            if not default_id:
+                default_id = selected_ids[0]
+            db.session.execute(
+                sqlite_insert(JudgeCheckpoint)
+                .values(
+                    [
+                        {
+                            "user_id": judge_id,
+                            "checkpoint_id": cid,
+                            "competition_id": comp_id,
+                            "is_default": cid == default_id,
+                        }
+                        for cid in dict.fromkeys(selected_ids)
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=["user_id", "checkpoint_id"])
+            )
+            JudgeCheckpoint.query.filter(*scope).update(
+                {JudgeCheckpoint.is_default: JudgeCheckpoint.checkpoint_id == default_id},
+                synchronize_session=False,
             )
-            JudgeCheckpoint.query.filter(
-                JudgeCheckpoint.user_id == judge_id,
-                JudgeCheckpoint.competition_id == comp_id,
-                JudgeCheckpoint.checkpoint_id == default_id,
-            ).update({JudgeCheckpoint.is_default: True}, synchronize_session=False)
 
         db.session.commit()
         flash(_("Judge checkpoints updated."), "success")
         return redirect(url_for("judges.assign_checkpoints", judge_id=judge_id))
 
+    members = (
+        db.session.query(User, CompetitionMember)
+        .join(CompetitionMember, CompetitionMember.user_id == User.id)
+        .filter(
+            CompetitionMember.competition_id == comp_id,
+            CompetitionMember.active.is_(True),
+            CompetitionMember.role.in_(["judge", "admin"]),
+        )
+        .order_by(User.username.asc())
+        .all()
+    )
+    judges = [{"id": u.id, "username": u.username, "role": m.role} for u, m in members]
+    checkpoints = (
+        Checkpoint.query.filter(Checkpoint.competition_id == comp_id)
+        .order_by(Checkpoint.position.asc().nulls_last(), Checkpoint.name.asc())
+        .all()
+    )
+
     selected_judge_id = request.args.get("judge_id", type=int)
     assigned = []
     default_checkpoint_id = None
@@ -1,30 +1,39 @@
 # app/blueprints/lora/routes.py
 from __future__ import annotations
 
+import time
 from datetime import datetime
+from functools import lru_cache
 
-from flask import Blueprint, flash, redirect, render_template, request, url_for
+from flask import Blueprint, current_app, flash, redirect, render_template, request, url_for
 from flask_babel import gettext as _
 
+from app.utils.competition import get_current_competition_id
 from app.utils.frontend_api import api_json
 from app.utils.perms import roles_required
 from app.utils.time import format_datetime_display
 
 lora_bp = Blueprint("lora", __name__, template_folder="../../templates")
 
+# Back-to-back refreshes of the device list reuse the last API result.
+DEVICE_LIST_CACHE_SECONDS = 5.0
+
+
+@lru_cache(maxsize=4096)
+def _display_last_seen(last_seen: str) -> str:
+    # Devices that share a heartbeat second share the raw timestamp string,
+    # so repeated list renders skip the parse and timezone conversion.
+    try:
+        return format_datetime_display(datetime.fromisoformat(last_seen))
+    except Exception:
+        return last_seen
+
 
 def _decorate_devices(devices):
     decorated = []
     for device in devices:
         last_seen = device.get("last_seen")
-        if last_seen:
-            try:
-                dt = datetime.fromisoformat(last_seen)
-                display_last_seen = format_datetime_display(dt)
-            except Exception:
-                display_last_seen = last_seen
-        else:
-            display_last_seen = "—"
+        display_last_seen = _display_last_seen(last_seen) if last_seen else "—"
 
         checkpoint = device.get("checkpoint") or {}
         checkpoint_name = checkpoint.get("name") if isinstance(checkpoint, dict) else None
@@ -41,12 +50,30 @@ def _decorate_devices(devices):
     return decorated
 
 
+def _device_cache() -> dict[int, tuple[float, list[dict]]]:
+    # Per-app (and so per-worker) so tests and separate app instances never
+    # share entries; a few seconds of staleness across workers is fine here.
+    return current_app.extensions.setdefault("lora_device_list_cache", {})
+
+
+def _invalidate_devices() -> None:
+    _device_cache().pop(get_current_competition_id(), None)
+
+
 def _fetch_devices():
+    competition_id = get_current_competition_id()
+    cache = _device_cache()
+    cached = cache.get(competition_id)
+    if cached and time.monotonic() - cached[0] < DEVICE_LIST_CACHE_SECONDS:
+        return cached[1]
+
     resp, payload = api_json("GET", "/api/devices")
     if resp.status_code != 200:
         flash(_("Could not load devices."), "warning")
         return []
-    return _decorate_devices(payload.get("devices", []))
+    devices = _decorate_devices(payload.get("devices", []))
+    cache[competition_id] = (time.monotonic(), devices)
+    return devices
 
 
 @lora_bp.route("/", methods=["GET"])
@@ -83,6 +110,7 @@ def add_device():
         )
 
         if resp.status_code == 201:
+            _invalidate_devices()
             flash(_("Device added."), "success")
             return redirect(url_for("lora.lora_list"))
 
@@ -91,64 +119,58 @@ def add_device():
     return render_template("lora_add.html")
 
 
+def _fetch_device(device_id: int) -> dict | None:
+    resp, payload = api_json("GET", f"/api/devices/{device_id}")
+    if resp.status_code != 200:
+        return None
+    return _decorate_devices([payload])[0] if payload else {}
+
+
 @lora_bp.route("/<int:device_id>/edit", methods=["GET", "POST"])
 @roles_required("judge", "admin")
 def edit_device(device_id: int):
-    device_resp, device_payload = api_json("GET", f"/api/devices/{device_id}")
-    if device_resp.status_code != 200:
-        flash(_("Device not found."), "warning")
-        return redirect(url_for("lora.lora_list"))
-
-    device = _decorate_devices([device_payload])[0] if device_payload else {}
-
     if request.method == "POST":
         dev_num = (request.form.get("dev_num") or "").strip()
         name = (request.form.get("name") or "").strip() or None
         note = (request.form.get("note") or "").strip() or None
         model = (request.form.get("model") or "").strip() or None
         active = bool(request.form.get("active"))
+        submitted = {
+            "dev_num": dev_num,
+            "name": name,
+            "note": note,
+            "model": model,
+            "active": active,
+        }
 
         if not dev_num:
             flash(_("Device number is required."), "warning")
-            device.update(
-                {
-                    "dev_num": dev_num,
-                    "name": name,
-                    "note": note,
-                    "model": model,
-                    "active": active,
-                }
-            )
-            return render_template("lora_edit.html", d=device)
-
-        resp, payload = api_json(
-            "PATCH",
-            f"/api/devices/{device_id}",
-            json={
-                "dev_num": dev_num,
-                "name": name,
-                "note": note,
-                "model": model,
-                "active": active,
-            },
-        )
-
-        if resp.status_code == 200:
-            flash(_("Device updated."), "success")
+        else:
+            # PATCH straight away; the device is only fetched when the form
+            # has to be re-rendered, so a successful save is one API call.
+            resp, payload = api_json("PATCH", f"/api/devices/{device_id}", json=submitted)
+
+            if resp.status_code == 200:
+                _invalidate_devices()
+                flash(_("Device updated."), "success")
+                return redirect(url_for("lora.lora_list"))
+            if resp.status_code == 404:
+                flash(_("Device not found."), "warning")
+                return redirect(url_for("lora.lora_list"))
+
+            flash(payload.get("detail") or payload.get("error") or _("Could not update device."), "warning")
+
+        device = _fetch_device(device_id)
+        if device is None:
+            flash(_("Device not found."), "warning")
             return redirect(url_for("lora.lora_list"))
+        device.update(submitted)
+        return render_template("lora_edit.html", d=_decorate_devices([device])[0])
 
-        flash(payload.get("detail") or payload.get("error") or _("Could not update device."), "warning")
-        device.update(
-            {
-                "dev_num": dev_num,
-                "name": name,
-                "note": note,
-                "model": model,
-                "active": active,
-            }
-        )
-        device = _decorate_devices([device])[0]
-
+    device = _fetch_device(device_id)
+    if device is None:
+        flash(_("Device not found."), "warning")
+        return redirect(url_for("lora.lora_list"))
     return render_template("lora_edit.html", d=device)
 
 
@@ -158,6 +180,7 @@ def delete_device(device_id: int):
     resp, payload = api_json("DELETE", f"/api/devices/{device_id}")
 
     if resp.status_code == 200:
+        _invalidate_devices()
         flash(_("Device deleted."), "success")
     else:
         flash(payload.get("detail") or payload.get("error") or _("Could not delete device."), "warning")
@@ -1,6 +1,8 @@
 # app/blueprints/map/routes.py
 from flask import Blueprint, render_template
+from sqlalchemy import select
 
+from app.extensions import db
 from app.models import LoRaDevice, Team
 from app.utils.competition import get_current_competition_id
 from app.utils.perms import roles_required
@@ -13,7 +15,10 @@ maps_bp = Blueprint("maps", __name__, template_folder="../../templates")
 def index():
     comp_id = get_current_competition_id()
     if comp_id:
-        teams = Team.query.filter(Team.competition_id == comp_id).order_by(Team.name.asc()).all()
+        # The team picker only shows id, name and number; skip hydrating Teams.
+        teams = db.session.execute(
+            select(Team.id, Team.name, Team.number).where(Team.competition_id == comp_id).order_by(Team.name.asc())
+        ).all()
     else:
         teams = []
     return render_template("map.html", teams=teams)
@@ -25,7 +30,11 @@ def index():
 def lora_map():
     comp_id = get_current_competition_id()
     if comp_id:
-        devices = LoRaDevice.query.filter(LoRaDevice.competition_id == comp_id).order_by(LoRaDevice.dev_num.asc()).all()
+        devices = db.session.execute(
+            select(LoRaDevice.dev_num, LoRaDevice.name)
+            .where(LoRaDevice.competition_id == comp_id)
+            .order_by(LoRaDevice.dev_num.asc())
+        ).all()
     else:
         devices = []
     return render_template("lora_map.html", devices=devices)
@@ -27,7 +27,7 @@ def _parse_checkpoint_ids(values) -> list[int]:
 
 
 def _fetch_checkpoints() -> list[dict]:
-    resp, payload = api_json("GET", "/api/checkpoints")
+    resp, payload = api_json("GET", "/api/checkpoints", params={"fields": "summary"})
     if resp.status_code != 200:
         flash(_("Could not load checkpoints."), "warning")
         return []
@@ -38,11 +38,13 @@ def _partition_checkpoints(
     all_checkpoints: list[dict],
     ordered_ids: list[int],
     minutes: list | None = None,
-) -> tuple[list[dict], list[dict]]:
+) -> tuple[list[tuple[dict, str | float | None]], list[dict]]:
     """Split into (selected in order, available). A checkpoint may appear
     more than once in ordered_ids (revisit paths), so 'available' keeps
-    every checkpoint; re-adding an already-used one is legal. minutes is
-    the aligned expected_leg_minutes list for redisplay."""
+    every checkpoint; re-adding an already-used one is legal. Selected
+    entries are (checkpoint, expected_leg_minutes) pairs, minutes taken
+    from the aligned list for redisplay; the checkpoint dict is shared,
+    not copied per stop."""
     lookup = {}
     for cp in all_checkpoints:
         cp_id = _parse_int(cp.get("id"))
@@ -50,12 +52,11 @@ def _partition_checkpoints(
             lookup[cp_id] = cp
     selected = []
     for idx, cid in enumerate(ordered_ids):
-        if cid not in lookup:
+        cp = lookup.get(cid)
+        if cp is None:
             continue
-        item = dict(lookup[cid])
         value = minutes[idx] if minutes and idx < len(minutes) else None
-        item["expected_leg_minutes"] = value if value not in ("", None) else None
-        selected.append(item)
+        selected.append((cp, value if value not in ("", None) else None))
     return selected, list(all_checkpoints)
 
 
@@ -71,7 +72,10 @@ def list_paths():
     return render_template("paths_list.html", paths=paths)
 
 
-def _render_form(mode: str, path: dict | None, selected: list[dict], available: list[dict]):
+def _render_form(mode: str, path: dict | None, selected_ids: list[int], minutes: list | None):
+    # The checkpoint list only feeds the form; a successful POST redirects
+    # without it, so it is fetched here rather than up front.
+    selected, available = _partition_checkpoints(_fetch_checkpoints(), selected_ids, minutes)
     return render_template(
         "path_edit.html",
         mode=mode,
@@ -84,34 +88,32 @@ def _render_form(mode: str, path: dict | None, selected: list[dict], available:
 @paths_bp.route("/add", methods=["GET", "POST"])
 @roles_required("judge", "admin")
 def add_path():
-    checkpoints = _fetch_checkpoints()
-    selected_ids = _parse_checkpoint_ids(request.form.getlist("checkpoint_ids")) if request.method == "POST" else []
-    form_minutes = request.form.getlist("expected_leg_minutes") if request.method == "POST" else None
-    selected_items, available_items = _partition_checkpoints(checkpoints, selected_ids, form_minutes)
-
-    if request.method == "POST":
-        name = (request.form.get("name") or "").strip()
-        notes = (request.form.get("notes") or "").strip() or None
-        if not name:
-            flash(_("Path name is required."), "warning")
-            return _render_form("add", None, selected_items, available_items)
-
-        resp, payload = api_json(
-            "POST",
-            "/api/paths",
-            json={
-                "name": name,
-                "notes": notes,
-                "checkpoint_ids": selected_ids,
-                "expected_leg_minutes": request.form.getlist("expected_leg_minutes"),
-            },
-        )
-        if resp.status_code == 201:
-            flash(_("Path created."), "success")
-            return redirect(url_for("paths.list_paths"))
-        flash(payload.get("detail") or payload.get("error") or _("Could not create path."), "warning")
+    if request.method != "POST":
+        return _render_form("add", None, [], None)
+
+    selected_ids = _parse_checkpoint_ids(request.form.getlist("checkpoint_ids"))
+    form_minutes = request.form.getlist("expected_leg_minutes")
+    name = (request.form.get("name") or "").strip()
+    notes = (request.form.get("notes") or "").strip() or None
+    if not name:
+        flash(_("Path name is required."), "warning")
+        return _render_form("add", None, selected_ids, form_minutes)
 
-    return _render_form("add", None, selected_items, available_items)
+    resp, payload = api_json(
+        "POST",
+        "/api/paths",
+        json={
+            "name": name,
+            "notes": notes,
+            "checkpoint_ids": selected_ids,
+            "expected_leg_minutes": form_minutes,
+        },
+    )
+    if resp.status_code == 201:
+        flash(_("Path created."), "success")
+        return redirect(url_for("paths.list_paths"))
+    flash(payload.get("detail") or payload.get("error") or _("Could not create path."), "warning")
+    return _render_form("add", None, selected_ids, form_minutes)
 
 
 @paths_bp.route("/<int:path_id>/edit", methods=["GET", "POST"])
@@ -122,42 +124,36 @@ def edit_path(path_id: int):
         flash(_("Path not found."), "warning")
         return redirect(url_for("paths.list_paths"))
 
-    checkpoints = _fetch_checkpoints()
-    existing_ids = [s.get("checkpoint_id") for s in path.get("stops", [])]
-    existing_minutes = [s.get("expected_leg_minutes") for s in path.get("stops", [])]
-    if request.method == "POST":
-        selected_ids = _parse_checkpoint_ids(request.form.getlist("checkpoint_ids"))
-        minutes = request.form.getlist("expected_leg_minutes")
-    else:
-        selected_ids = existing_ids
-        minutes = existing_minutes
-    selected_items, available_items = _partition_checkpoints(checkpoints, selected_ids, minutes)
-
-    if request.method == "POST":
-        name = (request.form.get("name") or "").strip()
-        notes = (request.form.get("notes") or "").strip() or None
-        if not name:
-            flash(_("Path name is required."), "warning")
-            return _render_form("edit", path, selected_items, available_items)
-
-        resp, payload = api_json(
-            "PATCH",
-            f"/api/paths/{path_id}",
-            json={
-                "name": name,
-                "notes": notes,
-                "checkpoint_ids": selected_ids,
-                "expected_leg_minutes": request.form.getlist("expected_leg_minutes"),
-            },
-        )
-        if resp.status_code == 200:
-            flash(_("Path updated."), "success")
-            return redirect(url_for("paths.list_paths"))
-        flash(payload.get("detail") or payload.get("error") or _("Could not update path."), "warning")
-        path["name"] = name
-        path["notes"] = notes
-
-    return _render_form("edit", path, selected_items, available_items)
+    if request.method != "POST":
+        existing_ids = [s.get("checkpoint_id") for s in path.get("stops", [])]
+        existing_minutes = [s.get("expected_leg_minutes") for s in path.get("stops", [])]
+        return _render_form("edit", path, existing_ids, existing_minutes)
+
+    selected_ids = _parse_checkpoint_ids(request.form.getlist("checkpoint_ids"))
+    minutes = request.form.getlist("expected_leg_minutes")
+    name = (request.form.get("name") or "").strip()
+    notes = (request.form.get("notes") or "").strip() or None
+    if not name:
+        flash(_("Path name is required."), "warning")
+        return _render_form("edit", path, selected_ids, minutes)
+
+    resp, payload = api_json(
+        "PATCH",
+        f"/api/paths/{path_id}",
+        json={
+            "name": name,
+            "notes": notes,
+            "checkpoint_ids": selected_ids,
+            "expected_leg_minutes": minutes,
+        },
+    )
+    if resp.status_code == 200:
+        flash(_("Path updated."), "success")
+        return redirect(url_for("paths.list_paths"))
+    flash(payload.get("detail") or payload.get("error") or _("Could not update path."), "warning")
+    path["name"] = name
+    path["notes"] = notes
+    return _render_form("edit", path, selected_ids, minutes)
 
 
 @paths_bp.route("/<int:path_id>/duplicate", methods=["POST"])
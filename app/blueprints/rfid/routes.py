@@ -76,16 +76,18 @@ def list_rfid():
 @roles_required("judge", "admin")
 def add_rfid():
     teams = _fetch_teams()
-    selected_team_id = request.form.get("team_id", type=int) if request.method == "POST" else None
-    uid_value = request.form.get("uid", "") if request.method == "POST" else ""
-    number_value = request.form.get("number", "") if request.method == "POST" else ""
+    selected_team_id = None
+    uid_value = number_value = ""
 
     if request.method == "POST":
-        uid = (request.form.get("uid") or "").strip()
-        team_id = request.form.get("team_id", type=int)
-        number = request.form.get("number", type=int)
+        # Each field is read once. The number goes to the API as typed: it
+        # maps blank to None and rejects anything else that isn't a positive
+        # integer, where type=int would silently drop it.
+        uid_value = request.form.get("uid", "")
+        selected_team_id = request.form.get("team_id", type=int)
+        number_value = request.form.get("number", "").strip()
 
-        payload = {"uid": uid, "team_id": team_id, "number": number}
+        payload = {"uid": uid_value.strip(), "team_id": selected_team_id, "number": number_value}
 
         resp, body = api_json("POST", "/api/rfid/cards", json=payload)
         if resp.status_code == 201:
@@ -113,16 +115,15 @@ def edit_rfid(card_id: int):
 
     card = card_payload
     teams = _fetch_teams()
-    selected_team_id = (
-        request.form.get("team_id", type=int) if request.method == "POST" else (card.get("team", {}) or {}).get("id")
-    )
+    selected_team_id = (card.get("team", {}) or {}).get("id")
 
     if request.method == "POST":
+        # Read once, number passed through as typed; see add_rfid.
         uid = (request.form.get("uid") or "").strip()
-        team_id = request.form.get("team_id", type=int)
-        number = request.form.get("number", type=int)
+        selected_team_id = request.form.get("team_id", type=int)
+        number = request.form.get("number", "").strip()
 
-        payload = {"uid": uid, "team_id": team_id, "number": number}
+        payload = {"uid": uid, "team_id": selected_team_id, "number": number}
 
         resp, body = api_json("PATCH", f"/api/rfid/cards/{card_id}", json=payload)
         if resp.status_code == 200:
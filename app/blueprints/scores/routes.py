@@ -3,12 +3,17 @@ from __future__ import annotations
 
 import csv
 import io
-import json
+import statistics
+import threading
+import time
+from collections import defaultdict
 from datetime import datetime
+from typing import NamedTuple
 
-from flask import Blueprint, Response, flash, redirect, render_template, request, url_for
+from flask import Blueprint, Response, current_app, flash, redirect, render_template, request, url_for
 from flask_babel import gettext as _
 from flask_login import current_user
+from sqlalchemy import and_, func, select
 from sqlalchemy.orm import joinedload
 
 from app.extensions import db
@@ -35,6 +40,7 @@ from app.utils.paths import (
     resolve_route_ids_bulk,
 )
 from app.utils.perms import roles_required
+from app.utils.scoring import _to_number
 from app.utils.time import format_datetime_display, format_time_display
 
 scores_bp = Blueprint("scores", __name__, template_folder="../../templates")
@@ -199,7 +205,7 @@ def scoring_setup_fields():
         params = None
         if raw_params:
             try:
-                parsed = json.loads(raw_params)
+                parsed = current_app.json.loads(raw_params)
             except Exception as exc:
                 return rule_type, None, str(exc)
             if not isinstance(parsed, dict):
@@ -449,6 +455,11 @@ def scoring_setup_group():
     return redirect(url_for("scores.scoring_setup"))
 
 
+class _GroupOption(NamedTuple):
+    id: int
+    name: str
+
+
 def _build_scores_context(comp_id: int, group_id: int | None, persist_auto_dnf: bool = False) -> dict:
     # persist_auto_dnf: whether to durably mark auto-DNF teams. Defaults
     # False so read-only surfaces (the PUBLIC unauthenticated results
@@ -462,37 +473,61 @@ def _build_scores_context(comp_id: int, group_id: int | None, persist_auto_dnf:
         .all()
     )
     group_order = [g.name for g in groups if g.name]
-    teams_query = Team.query.filter(Team.competition_id == comp_id)
+    group_by_id = {g.id: g for g in groups}
+    # Teams and their active category link in one query; the group rows are
+    # already loaded above, so names come from group_by_id.
+    teams_query = (
+        select(Team, TeamGroup.group_id)
+        .outerjoin(TeamGroup, and_(TeamGroup.team_id == Team.id, TeamGroup.active.is_(True)))
+        .where(Team.competition_id == comp_id)
+    )
     if group_id:
-        teams_query = teams_query.join(TeamGroup, TeamGroup.team_id == Team.id).filter(
-            TeamGroup.group_id == group_id, TeamGroup.active.is_(True)
-        )
-    teams = teams_query.order_by(Team.number.asc().nulls_last(), Team.name.asc()).all()
+        teams_query = teams_query.where(TeamGroup.group_id == group_id)
+    teams = []
+    team_groups = {}
+    team_group_ids = {}
+    seen_team_ids = set()
+    for team, link_group_id in db.session.execute(
+        teams_query.order_by(Team.number.asc().nulls_last(), Team.name.asc())
+    ):
+        if team.id not in seen_team_ids:
+            seen_team_ids.add(team.id)
+            teams.append(team)
+        link_group = group_by_id.get(link_group_id)
+        if link_group and team.id not in team_group_ids:
+            team_groups[team.id] = link_group.name
+            team_group_ids[team.id] = link_group_id
     team_ids = [t.id for t in teams]
 
-    entries = []
+    latest = []
     if team_ids:
-        entries = (
-            ScoreEntry.query.filter(ScoreEntry.competition_id == comp_id)
-            .filter(ScoreEntry.team_id.in_(team_ids))
-            .order_by(ScoreEntry.created_at.desc())
-            .all()
+        # Only the newest entry per (team, checkpoint) counts; rank them in
+        # SQL so resubmitted scores never leave the database, and pull the
+        # dead time out of raw_fields there instead of decoding every blob.
+        ranked = (
+            select(
+                ScoreEntry.team_id,
+                ScoreEntry.checkpoint_id,
+                ScoreEntry.total,
+                func.coalesce(
+                    func.json_extract(ScoreEntry.raw_fields, "$.dead_time"),
+                    func.json_extract(ScoreEntry.raw_fields, '$."Dead Time"'),
+                ).label("dead_time"),
+                func.row_number()
+                .over(
+                    partition_by=(ScoreEntry.team_id, ScoreEntry.checkpoint_id),
+                    order_by=(ScoreEntry.created_at.desc(), ScoreEntry.id.desc()),
+                )
+                .label("rank"),
+            )
+            .where(ScoreEntry.competition_id == comp_id, ScoreEntry.team_id.in_(team_ids))
+            .subquery()
         )
-
-    latest = {}
-    for entry in entries:
-        key = (entry.team_id, entry.checkpoint_id)
-        if key not in latest:
-            latest[key] = entry
-
-    team_groups = {}
-    team_group_ids = {}
-    if team_ids:
-        links = TeamGroup.query.filter(TeamGroup.team_id.in_(team_ids), TeamGroup.active.is_(True)).all()
-        for link in links:
-            if link.team_id not in team_groups and link.group:
-                team_groups[link.team_id] = link.group.name
-                team_group_ids[link.team_id] = link.group_id
+        latest = db.session.execute(
+            select(ranked.c.team_id, ranked.c.checkpoint_id, ranked.c.total, ranked.c.dead_time).where(
+                ranked.c.rank == 1
+            )
+        ).all()
 
     group_checkpoint_ids = {}
     group_checkpoint_order = {}
@@ -519,21 +554,16 @@ def _build_scores_context(comp_id: int, group_id: int | None, persist_auto_dnf:
     dead_times = {team_id: 0.0 for team_id in team_ids}
     per_team_points: dict[int, dict[int, float | None]] = {team_id: {} for team_id in team_ids}
     allowed_checkpoint_ids = {team_id: set() for team_id in team_ids}
-    for (team_id, _checkpoint_id), entry in latest.items():
+    for team_id, checkpoint_id, entry_total, dead_val in latest:
         group_id_for_team = team_group_ids.get(team_id)
         if group_id_for_team:
             allowed = group_checkpoint_ids.get(group_id_for_team, set())
-            if entry.checkpoint_id not in allowed:
+            if checkpoint_id not in allowed:
                 continue
-        if entry.total is not None:
-            totals[team_id] += float(entry.total)
-        per_team_points.setdefault(team_id, {})[entry.checkpoint_id] = entry.total
-        raw = entry.raw_fields or {}
-        dead_val = raw.get("dead_time", raw.get("Dead Time"))
-        try:
-            dead_num = float(dead_val)
-        except Exception:
-            dead_num = None
+        if entry_total is not None:
+            totals[team_id] += float(entry_total)
+        per_team_points[team_id][checkpoint_id] = entry_total
+        dead_num = _to_number(dead_val)
         if dead_num is not None:
             dead_times[team_id] += dead_num
     for team_id in team_ids:
@@ -541,57 +571,67 @@ def _build_scores_context(comp_id: int, group_id: int | None, persist_auto_dnf:
         if group_id_for_team:
             allowed_checkpoint_ids[team_id] = group_checkpoint_ids.get(group_id_for_team, set())
 
-    # Whole-race elapsed minutes between the route's directed start/finish.
+    # Whole-race elapsed minutes between the route's directed start/finish,
+    # and whether the team reached its finish, from one check-in fetch.
     team_time_minutes: dict[int, float | None] = {team_id: None for team_id in team_ids}
-    if team_ids and group_start_checkpoint and group_final_checkpoint:
+    finished_map = {team_id: False for team_id in team_ids}
+    if team_ids and group_final_checkpoint:
         start_ids = {cid for cid in group_start_checkpoint.values() if cid}
         end_ids = {cid for cid in group_final_checkpoint.values() if cid}
-        checkins = (
-            Checkin.query.filter(Checkin.competition_id == comp_id)
-            .filter(Checkin.team_id.in_(team_ids))
-            .filter(Checkin.checkpoint_id.in_(start_ids.union(end_ids)))
+        checkins = db.session.execute(
+            select(Checkin.team_id, Checkin.checkpoint_id, Checkin.timestamp)
+            .where(
+                Checkin.competition_id == comp_id,
+                Checkin.team_id.in_(team_ids),
+                Checkin.checkpoint_id.in_(start_ids | end_ids),
+            )
             .order_by(Checkin.timestamp.asc())
-            .all()
         )
         team_cp_times: dict[int, dict[int, datetime]] = {tid: {} for tid in team_ids}
-        for c in checkins:
-            if c.checkpoint_id not in team_cp_times.get(c.team_id, {}):
-                team_cp_times.setdefault(c.team_id, {})[c.checkpoint_id] = c.timestamp
+        for checkin_team_id, checkin_cp_id, checkin_ts in checkins:
+            arrivals = team_cp_times[checkin_team_id]
+            if checkin_cp_id not in arrivals:
+                arrivals[checkin_cp_id] = checkin_ts
         for team_id in team_ids:
             group_id_for_team = team_group_ids.get(team_id)
             if not group_id_for_team:
                 continue
             start_id = group_start_checkpoint.get(group_id_for_team)
             end_id = group_final_checkpoint.get(group_id_for_team)
-            if not start_id or not end_id:
+            if not end_id:
                 continue
-            start_ts = team_cp_times.get(team_id, {}).get(start_id)
-            end_ts = team_cp_times.get(team_id, {}).get(end_id)
+            arrivals = team_cp_times[team_id]
+            finished_map[team_id] = end_id in arrivals
+            start_ts = arrivals.get(start_id)
+            end_ts = arrivals.get(end_id)
             if start_ts and end_ts and end_ts >= start_ts:
                 team_time_minutes[team_id] = (end_ts - start_ts).total_seconds() / 60.0
 
     # Timed segments per group (endpoints already direction-swapped by the
     # resolver) and their per-team results, computed at read time, never
     # stored in ScoreEntry, so the leaderboard is always live.
-    from app.utils.scoring import compute_group_contrib, compute_segment_results, resolve_group_segments
+    from app.utils.scoring import compute_group_contribs, compute_segment_results, resolve_group_segments
 
-    group_by_id = {g.id: g for g in groups}
     segment_results: dict[int, dict[int, list[dict]]] = {}  # group_id -> team_id -> [results]
+    teams_by_group: dict[int, list[int]] = defaultdict(list)
     if team_group_ids:
-        teams_by_group: dict[int, list[int]] = {}
         for tid, gid in team_group_ids.items():
             if gid:
-                teams_by_group.setdefault(gid, []).append(tid)
+                teams_by_group[gid].append(tid)
         for gid, pool in teams_by_group.items():
             segments = resolve_group_segments(group_by_id.get(gid))
-            per_team: dict[int, list[dict]] = {}
+            per_team: dict[int, list[dict]] = defaultdict(list)
             for segment in segments:
                 results = compute_segment_results(comp_id, pool, segment)
                 for tid, result in results.items():
-                    per_team.setdefault(tid, []).append(result)
+                    per_team[tid].append(result)
             segment_results[gid] = per_team
 
-    # Category-level contribution (found points + race time rule).
+    # Category-level contribution (found points + race time rule), one
+    # batch per category rather than a round of queries per team.
+    contribs: dict[int, dict] = {}
+    for gid, pool in teams_by_group.items():
+        contribs.update(compute_group_contribs(comp_id, pool, group_by_id.get(gid)))
     global_totals = {}
     global_time_points = {}
     global_found_points = {}
@@ -603,7 +643,7 @@ def _build_scores_context(comp_id: int, group_id: int | None, persist_auto_dnf:
             global_time_points[team_id] = 0.0
             global_found_points[team_id] = 0.0
             continue
-        contrib = compute_group_contrib(comp_id, team_id, group_by_id.get(group_id_for_team))
+        contrib = contribs[team_id]
         global_totals[team_id] = contrib["total"] or 0.0
         global_time_points[team_id] = contrib["time_points"] or 0.0
         global_found_points[team_id] = contrib["found_points"] or 0.0
@@ -623,31 +663,15 @@ def _build_scores_context(comp_id: int, group_id: int | None, persist_auto_dnf:
             db.session.commit()
 
     rows = []
-    finished_map = {team_id: False for team_id in team_ids}
-    final_checkpoint_ids = {cp_id for cp_id in group_final_checkpoint.values() if cp_id}
-    if team_ids and final_checkpoint_ids:
-        checkins = (
-            db.session.query(Checkin.team_id, Checkin.checkpoint_id)
-            .filter(Checkin.competition_id == comp_id)
-            .filter(Checkin.team_id.in_(team_ids))
-            .filter(Checkin.checkpoint_id.in_(final_checkpoint_ids))
-            .all()
-        )
-        for team_id, checkpoint_id in checkins:
-            group_id_for_team = team_group_ids.get(team_id)
-            if group_id_for_team and group_final_checkpoint.get(group_id_for_team) == checkpoint_id:
-                finished_map[team_id] = True
-
     for team in teams:
         team_group_id = team_group_ids.get(team.id)
         raw_min = team_time_minutes.get(team.id)
-        team_obj = next((t for t in teams if t.id == team.id), None)
         # Timed segments: four values per segment (contract from the
         # redesign plan 3.3): start/end arrival, diff, points. Segment
         # points join the total here; they are never stored in ScoreEntry.
         team_segments = []
         segment_points_total = 0.0
-        for result in (segment_results.get(team_group_id, {}) or {}).get(team.id, []):
+        for result in segment_results.get(team_group_id, {}).get(team.id, []):
             if result.get("points") is not None:
                 segment_points_total += float(result["points"])
             team_segments.append(
@@ -670,11 +694,11 @@ def _build_scores_context(comp_id: int, group_id: int | None, persist_auto_dnf:
                 "group": team_groups.get(team.id, ""),
                 "total": team_total,
                 "dead_time": dead_times.get(team.id, 0.0),
-                "bonus_dead_time": float(team_obj.bonus_dead_time) if (team_obj and team_obj.bonus_dead_time) else 0.0,
+                "bonus_dead_time": float(team.bonus_dead_time) if team.bonus_dead_time else 0.0,
                 "global_time": global_time_points.get(team.id, 0.0),
                 "global_found": global_found_points.get(team.id, 0.0),
                 "time_minutes": raw_min,
-                "notes": team_obj.notes if team_obj and team_obj.notes else "",
+                "notes": team.notes or "",
                 "segments": team_segments,
                 "segment_points": segment_points_total,
                 "dnf": bool(team.dnf) or team.id in auto_dnf_ids,
@@ -684,12 +708,15 @@ def _build_scores_context(comp_id: int, group_id: int | None, persist_auto_dnf:
             }
         )
 
-    group_order_norm = [g.lower().strip() for g in group_order]
+    # Position of each group in the configured order; setdefault keeps the
+    # first position when two names normalise to the same key.
+    group_rank: dict[str, int] = {}
+    for idx, name in enumerate(group_order):
+        group_rank.setdefault(name.lower().strip(), idx)
 
     def _row_sort_key(row: dict):
         group_name = (row.get("group") or "").strip()
-        group_norm = group_name.lower().strip()
-        group_idx = group_order_norm.index(group_norm) if group_norm in group_order_norm else len(group_order_norm)
+        group_idx = group_rank.get(group_name.lower(), len(group_order))
         total_val = float(row.get("total") or 0.0)
         return (group_idx, group_name, 1 if row.get("dnf") else 0, -total_val, row.get("name") or "")
 
@@ -721,17 +748,24 @@ def _build_scores_context(comp_id: int, group_id: int | None, persist_auto_dnf:
         key=lambda e: (-float(e["total"] or 0.0), e["name"].lower()),
     )
 
-    checkpoints_query = Checkpoint.query.filter(Checkpoint.competition_id == comp_id)
+    # Column headers only need id, name and (for the CSV) description, so
+    # plain rows instead of Checkpoint entities.
+    checkpoints_query = select(Checkpoint.id, Checkpoint.name, Checkpoint.description).where(
+        Checkpoint.competition_id == comp_id
+    )
     if group_id:
-        selected_group = db.session.get(CheckpointGroup, group_id)
-        cp_ids = resolve_route_ids(selected_group)
+        cp_ids = resolve_route_ids(group_by_id.get(group_id))
         if cp_ids:
-            checkpoints_query = checkpoints_query.filter(Checkpoint.id.in_(cp_ids))
-    checkpoints = checkpoints_query.order_by(Checkpoint.position.asc().nulls_last(), Checkpoint.name.asc()).all()
+            checkpoints_query = checkpoints_query.where(Checkpoint.id.in_(cp_ids))
+    checkpoints = db.session.execute(
+        checkpoints_query.order_by(Checkpoint.position.asc().nulls_last(), Checkpoint.name.asc())
+    ).all()
 
+    # The public results cache shares this dict across requests, so the
+    # group filter gets plain (id, name) rows rather than the entities.
     return {
         "rows": rows,
-        "groups": groups,
+        "groups": [_GroupOption(g.id, g.name) for g in groups],
         "selected_group_id": group_id,
         "checkpoints": checkpoints,
         "per_team_points": per_team_points,
@@ -864,6 +898,43 @@ def view_scores_export_csv():
     )
 
 
+_public_cache_lock = threading.Lock()
+
+
+def _public_results_version(comp_id: int) -> tuple:
+    """Cheap fingerprint of the rows a leaderboard is built from: a new or
+    deleted score entry or check-in changes it."""
+    aggregates = [
+        select(agg).where(model.competition_id == comp_id).scalar_subquery()
+        for model in (ScoreEntry, Checkin)
+        for agg in (func.count(model.id), func.max(model.id))
+    ]
+    return tuple(db.session.execute(select(*aggregates)).one())
+
+
+def _cached_public_context(cache_name: str, comp_id: int, build, *args) -> dict:
+    """Reuse a context built for an earlier anonymous viewer while it is
+    younger than PUBLIC_RESULTS_CACHE_SECONDS and the results version is
+    unchanged. The cache lives on the app, so each app (and test) starts
+    empty; expired entries are dropped whenever a new one is stored."""
+    ttl = current_app.config.get("PUBLIC_RESULTS_CACHE_SECONDS") or 0
+    if ttl <= 0:
+        return build(comp_id, *args)
+    cache = current_app.extensions.setdefault(cache_name, {})
+    key = (comp_id, *args)
+    version = _public_results_version(comp_id)
+    now = time.monotonic()
+    hit = cache.get(key)
+    if hit and hit[1] == version and now - hit[0] < ttl:
+        return hit[2]
+    context = build(comp_id, *args)
+    with _public_cache_lock:
+        for stale_key in [k for k, (built_at, _v, _c) in cache.items() if now - built_at >= ttl]:
+            del cache[stale_key]
+        cache[key] = (now, version, context)
+    return context
+
+
 @scores_bp.route("/public/<int:competition_id>", methods=["GET"])
 def public_scores(competition_id: int):
     competition = Competition.query.filter(Competition.id == competition_id).first()
@@ -871,7 +942,16 @@ def public_scores(competition_id: int):
         flash(_("Public results are not enabled for this competition."), "warning")
         return redirect(url_for("main.index"))
     group_id = request.args.get("group_id", type=int)
-    context = _build_scores_context(competition_id, group_id)
+    # Only this competition's groups get their own cache entry; any other id
+    # shows all groups, so anonymous ?group_id= values cannot grow the cache.
+    if group_id is not None:
+        group_id = db.session.scalar(
+            select(CheckpointGroup.id).where(
+                CheckpointGroup.competition_id == competition_id, CheckpointGroup.id == group_id
+            )
+        )
+    # Copy: the cached context is shared between viewers.
+    context = dict(_cached_public_context("public_scores_cache", competition_id, _build_scores_context, group_id))
     context["show_actions"] = False
     context["public_competition"] = competition
     return render_template("scores_view.html", **context)
@@ -934,31 +1014,30 @@ def _build_stats_context(comp_id: int) -> dict:
     context = _build_scores_context(comp_id, None)
     rows = context.get("rows", [])
 
-    rows_by_group = {}
+    rows_by_group = defaultdict(list)
     for row in rows:
         group_name = (row.get("group") or "").strip()
         if not group_name:
             continue
-        rows_by_group.setdefault(group_name, []).append(row)
+        rows_by_group[group_name].append(row)
 
-    team_groups = (
-        TeamGroup.query.join(Team, TeamGroup.team_id == Team.id)
-        .filter(Team.competition_id == comp_id, TeamGroup.active.is_(True))
-        .all()
+    team_groups = db.session.execute(
+        select(TeamGroup.team_id, TeamGroup.group_id)
+        .join(Team, TeamGroup.team_id == Team.id)
+        .where(Team.competition_id == comp_id, TeamGroup.active.is_(True))
     )
-    teams_by_group_id = {}
-    for link in team_groups:
-        teams_by_group_id.setdefault(link.group_id, set()).add(link.team_id)
+    teams_by_group_id = defaultdict(set)
+    for link_team_id, link_group_id in team_groups:
+        teams_by_group_id[link_group_id].add(link_team_id)
 
     # Virtual checkpoints award points but have no check-in timestamps,
     # so they must be excluded from any arrival-time based stat
     # (overall/segment durations, fastest team, drop-off, checkpoint count).
-    virtual_cp_ids = {
-        cp_id
-        for (cp_id,) in db.session.query(Checkpoint.id)
-        .filter(Checkpoint.competition_id == comp_id, Checkpoint.is_virtual.is_(True))
-        .all()
-    }
+    virtual_cp_ids = set(
+        db.session.scalars(
+            select(Checkpoint.id).where(Checkpoint.competition_id == comp_id, Checkpoint.is_virtual.is_(True))
+        )
+    )
 
     # Directed per-group routes; stats segments now follow the traversal
     # direction instead of raw link order.
@@ -970,6 +1049,29 @@ def _build_stats_context(comp_id: int) -> dict:
         .all()
     }
 
+    # First arrival per (team, checkpoint) for every grouped team, fetched
+    # in one query; each group below keeps only its own physical route.
+    physical_cp_ids_by_group = {
+        gid: [cid for cid in route if cid not in virtual_cp_ids] for gid, route in checkpoint_order_by_group.items()
+    }
+    grouped_team_ids = set().union(*teams_by_group_id.values())
+    route_cp_ids = set().union(*physical_cp_ids_by_group.values())
+    first_arrivals: dict[int, dict[int, datetime]] = defaultdict(dict)
+    if grouped_team_ids and route_cp_ids:
+        checkins = db.session.execute(
+            select(Checkin.team_id, Checkin.checkpoint_id, Checkin.timestamp)
+            .where(
+                Checkin.competition_id == comp_id,
+                Checkin.team_id.in_(grouped_team_ids),
+                Checkin.checkpoint_id.in_(route_cp_ids),
+            )
+            .order_by(Checkin.timestamp.asc())
+        )
+        for checkin_team_id, checkin_cp_id, checkin_ts in checkins:
+            arrivals = first_arrivals[checkin_team_id]
+            if checkin_cp_id not in arrivals:
+                arrivals[checkin_cp_id] = checkin_ts
+
     overall_durations: list[tuple[int, str, str | None, float]] = []
     overall_checkpoint_counts: list[int] = []
 
@@ -1006,22 +1108,12 @@ def _build_stats_context(comp_id: int) -> dict:
         finished_count = sum(1 for r in group_rows if r.get("finished"))
         completion_rate = (finished_count / len(group_rows)) if group_rows else 0
 
-        cp_ids = checkpoint_order_by_group.get(group.id, [])
-        physical_cp_ids = [cid for cid in cp_ids if cid not in virtual_cp_ids]
-        checkins = []
-        if physical_cp_ids:
-            checkins = (
-                Checkin.query.filter(Checkin.competition_id == comp_id)
-                .filter(Checkin.team_id.in_(team_ids))
-                .filter(Checkin.checkpoint_id.in_(physical_cp_ids))
-                .order_by(Checkin.timestamp.asc())
-                .all()
-            )
-
-        team_cp_times = {tid: {} for tid in team_ids}
-        for c in checkins:
-            if c.checkpoint_id not in team_cp_times.get(c.team_id, {}):
-                team_cp_times.setdefault(c.team_id, {})[c.checkpoint_id] = c.timestamp
+        physical_cp_ids = physical_cp_ids_by_group.get(group.id, [])
+        physical_cp_set = set(physical_cp_ids)
+        team_cp_times = {
+            tid: {cid: ts for cid, ts in first_arrivals.get(tid, {}).items() if cid in physical_cp_set}
+            for tid in team_ids
+        }
 
         avg_checkpoint_count = None
         if physical_cp_ids:
@@ -1048,20 +1140,14 @@ def _build_stats_context(comp_id: int) -> dict:
                     minutes = (end_ts - start_ts).total_seconds() / 60.0
                     durations.append((tid, minutes))
             if durations:
-                avg_time_minutes = sum(d[1] for d in durations) / len(durations)
-                sorted_minutes = sorted(d[1] for d in durations)
-                mid = len(sorted_minutes) // 2
-                if len(sorted_minutes) % 2 == 1:
-                    median_time_minutes = sorted_minutes[mid]
-                else:
-                    median_time_minutes = (sorted_minutes[mid - 1] + sorted_minutes[mid]) / 2.0
+                group_minutes = [d[1] for d in durations]
+                avg_time_minutes = statistics.fmean(group_minutes)
+                median_time_minutes = statistics.median(group_minutes)
                 fastest_tid, fastest_minutes = min(durations, key=lambda d: d[1])
-                fastest_row = next((r for r in group_rows if r.get("id") == fastest_tid), None)
-                fastest_team = fastest_row.get("name") if fastest_row else None
+                name_by_id = {r.get("id"): r.get("name") for r in group_rows}
+                fastest_team = name_by_id.get(fastest_tid)
                 for tid, minutes in durations:
-                    team_row = next((r for r in group_rows if r.get("id") == tid), None)
-                    team_name = team_row.get("name") if team_row else None
-                    overall_durations.append((tid, group.name, team_name, minutes))
+                    overall_durations.append((tid, group.name, name_by_id.get(tid), minutes))
 
         segments = []
         if len(physical_cp_ids) >= 2:
@@ -1132,13 +1218,8 @@ def _build_stats_context(comp_id: int) -> dict:
     overall_fastest_minutes = None
     if overall_durations:
         minutes_list = [d[3] for d in overall_durations]
-        overall_avg_time = sum(minutes_list) / len(minutes_list)
-        sorted_minutes = sorted(minutes_list)
-        mid = len(sorted_minutes) // 2
-        if len(sorted_minutes) % 2 == 1:
-            overall_median_time = sorted_minutes[mid]
-        else:
-            overall_median_time = (sorted_minutes[mid - 1] + sorted_minutes[mid]) / 2.0
+        overall_avg_time = statistics.fmean(minutes_list)
+        overall_median_time = statistics.median(minutes_list)
         fastest = min(overall_durations, key=lambda d: d[3])
         overall_fastest_team = fastest[2]
         overall_fastest_group = fastest[1]
@@ -1180,7 +1261,8 @@ def public_stats(competition_id: int):
     if not competition or not competition.public_results:
         flash(_("Public results are not enabled for this competition."), "warning")
         return redirect(url_for("main.index"))
-    context = _build_stats_context(competition_id)
+    # Copy: the cached context is shared between viewers.
+    context = dict(_cached_public_context("public_stats_cache", competition_id, _build_stats_context))
     context["public_competition"] = competition
     return render_template("scores_stats.html", **context)
 
@@ -1233,12 +1315,7 @@ def score_submissions():
     rows = []
     for entry in entries:
         raw = entry.raw_fields or {}
-        dead_val = raw.get("dead_time", raw.get("Dead Time"))
-        dead_num = None
-        try:
-            dead_num = float(dead_val)
-        except Exception:
-            dead_num = None
+        dead_num = _to_number(raw.get("dead_time", raw.get("Dead Time")))
         # Display team as "<number> - <name>" when a number is assigned,
         # otherwise fall back to the bare name. Lets operators scan
         # submissions by team number without flipping to the roster.
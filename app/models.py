@@ -359,9 +359,13 @@ class RFIDCard(db.Model):
     competition = db.relationship("Competition")
     team = db.relationship("Team", back_populates="rfid_card")
 
+    # The card list is scoped to one competition and ordered by number then
+    # uid; leading with competition_id lets the index serve both the filter
+    # and the ORDER BY without a temp-table sort.
     __table_args__ = (
         UniqueConstraint("competition_id", "uid", name="uq_rfid_competition_uid"),
         CheckConstraint("number IS NULL OR number > 0", name="ck_rfid_number_positive"),
+        Index("ix_rfid_cards_competition_number_uid", "competition_id", "number", "uid"),
     )
 
     def __repr__(self) -> str:
@@ -587,7 +591,13 @@ class Checkin(db.Model):
         passive_deletes=True,
     )
 
-    __table_args__ = (db.UniqueConstraint("team_id", "checkpoint_id", name="uq_team_checkpoint"),)
+    # Check-in lists and exports filter by competition and a half-open
+    # [from, to) timestamp range, newest first; the composite index serves
+    # both the range and the ORDER BY without a temp-table sort.
+    __table_args__ = (
+        db.UniqueConstraint("team_id", "checkpoint_id", name="uq_team_checkpoint"),
+        Index("ix_checkins_competition_timestamp", "competition_id", "timestamp"),
+    )
 
     def __repr__(self) -> str:
         return (
@@ -4,11 +4,12 @@ from __future__ import annotations
 import csv
 import io
 from datetime import datetime, timedelta
+from functools import lru_cache
 
-from flask import Blueprint, jsonify, make_response, request
+from flask import Blueprint, current_app, jsonify, make_response, request
 from flask_login import current_user
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import Load, joinedload
 
 from app.extensions import db
 from app.models import Checkin, Checkpoint, JudgeCheckpoint, Team
@@ -24,12 +25,14 @@ checkins_api_bp = Blueprint("api_checkins", __name__)
 
 
 # -------- helpers --------
+@lru_cache(maxsize=256)
 def _parse_date_range(date_from_str: str | None, date_to_str: str | None) -> tuple[datetime | None, datetime | None]:
     """Build an inclusive range for YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS inputs.
 
     Raises ValueError for malformed inputs. Callers must catch this and
     return a 400 - silently ignoring a typo would expand the result set
-    (e.g. exporting *all* check-ins instead of one day's)."""
+    (e.g. exporting *all* check-ins instead of one day's). Memoized for
+    polling clients that resend the same bounds; errors are never cached."""
     start = end = None
     if date_from_str:
         start = datetime.fromisoformat(date_from_str)
@@ -51,6 +54,11 @@ def _filtered_query(team_id: int | None, checkpoint_id: int | None, date_from: s
         joinedload(Checkin.created_by_user),
         joinedload(Checkin.created_by_device),
     )
+    if current_app.config.get("RAISELOAD_GUARD"):
+        # Bound to Checkin: a bare raiseload("*") would also stamp the joined
+        # Team/Checkpoint rows, which then raise when later code in the same
+        # session reads their own relationships.
+        q = q.options(Load(Checkin).raiseload("*"))
     if comp_id:
         q = q.filter(Checkin.competition_id == comp_id)
 
@@ -1,12 +1,17 @@
 # app/resources/ingest.py
 from __future__ import annotations
 
+import codecs
 import hmac
+import math
 from datetime import datetime, timedelta
 
 from flask import Blueprint, current_app, request
 from flask_login import current_user
+from sqlalchemy import insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import joinedload
 from werkzeug.exceptions import BadRequest
 
 from app.api.helpers import parse_int
@@ -23,6 +28,7 @@ from app.models import (
 )
 from app.utils.audit import format_device_label, record_audit_event
 from app.utils.card_tokens import compute_card_digest, looks_like_card_uid
+from app.utils.listing_cache import invalidate_listing
 from app.utils.payloads import parse_gps_payload
 from app.utils.serial_helpers import normalize_uid
 from app.utils.sheets_sync import mark_arrival_checkbox
@@ -30,56 +36,106 @@ from app.utils.time import utc_from_timestamp_naive, utcnow_naive
 
 ingest_api_bp = Blueprint("api_ingest", __name__)
 
+# Upper bound on one /api/ingest/batch call; a gateway burst is a few dozen.
+INGEST_BATCH_MAX_MESSAGES = 200
 
-def resolve_checkpoint_for_dev(competition_id: int, dev_num: int) -> tuple[Checkpoint, LoRaDevice, bool, bool]:
-    device = LoRaDevice.query.filter_by(competition_id=competition_id, dev_num=dev_num).first()
-    created_device = False
-    created_checkpoint = False
 
-    if device:
-        if device.checkpoint:
-            return device.checkpoint, device, created_device, created_checkpoint
-
-        cp = Checkpoint.query.filter_by(lora_device_id=device.id).first()
-        if cp:
-            return cp, device, created_device, created_checkpoint
-
-        cp = Checkpoint(
-            competition_id=competition_id,
-            name=f"Device {dev_num}",
-            description="Auto-created from device ingest",
-            lora_device_id=device.id,
-        )
-        db.session.add(cp)
-        db.session.flush()
-        created_checkpoint = True
-        return cp, device, created_device, created_checkpoint
+def _load_devices(competition_id: int, dev_nums) -> dict[int, LoRaDevice]:
+    dev_nums = list(dev_nums)
+    if not dev_nums:
+        return {}
+    # device.checkpoint is the inverse of Checkpoint.lora_device_id, so one
+    # joined SELECT answers both "which device" and "which checkpoint".
+    devices = (
+        LoRaDevice.query.options(joinedload(LoRaDevice.checkpoint))
+        .filter(LoRaDevice.competition_id == competition_id, LoRaDevice.dev_num.in_(dev_nums))
+        .all()
+    )
+    return {device.dev_num: device for device in devices}
+
+
+def _uid_from_payload(payload) -> str:
+    # Some senders (v2 LoRa protocol) append "|<HMAC>" to the payload
+    # for offline tag verification; drop the suffix before lookup.
+    # Then normalize the same way /api/rfid/cards normalizes on write
+    # (strip ':' and '-', uppercase) so colon-separated NFC UIDs match
+    # the canonical DB form.
+    return normalize_uid(str(payload).split("|", 1)[0])
+
+
+def _load_cards(competition_id: int, uids) -> dict[str, RFIDCard]:
+    uids = [uid for uid in uids if uid]
+    if not uids:
+        return {}
+    cards = (
+        RFIDCard.query.options(joinedload(RFIDCard.team))
+        .filter(RFIDCard.competition_id == competition_id, RFIDCard.uid.in_(uids))
+        .all()
+    )
+    return {card.uid: card for card in cards}
 
-    device = LoRaDevice(competition_id=competition_id, dev_num=dev_num, name=f"DEV-{dev_num}", active=True)
-    db.session.add(device)
-    db.session.flush()
-    created_device = True
 
-    cp = Checkpoint(
+def _placeholder_checkpoint(competition_id: int, dev_num: int, device: LoRaDevice) -> Checkpoint:
+    return Checkpoint(
         competition_id=competition_id,
         name=f"Device {dev_num}",
         description="Auto-created from device ingest",
-        lora_device_id=device.id,
+        lora_device=device,
     )
+
+
+def resolve_checkpoint_for_dev(
+    competition_id: int, dev_num: int, devices: dict[int, LoRaDevice] | None = None
+) -> tuple[Checkpoint, LoRaDevice, bool, bool]:
+    """Return (checkpoint, device, created_device, created_checkpoint),
+    creating the device and/or its placeholder checkpoint on first sight.
+
+    devices is an optional dev_num -> device map preloaded by the caller
+    (batch ingest); devices created here are added to it."""
+    if devices is None:
+        devices = _load_devices(competition_id, [dev_num])
+    device = devices.get(dev_num)
+
+    if device is None:
+        # First packet from this gateway: device and checkpoint go out in
+        # one flush. Two gateways' first packets racing on the same
+        # dev_num meet at uq_device_competition_devnum; the loser's
+        # savepoint rolls back and it picks up the winner's device.
+        device = LoRaDevice(competition_id=competition_id, dev_num=dev_num, name=f"DEV-{dev_num}", active=True)
+        cp = _placeholder_checkpoint(competition_id, dev_num, device)
+        try:
+            with db.session.begin_nested():
+                db.session.add_all([device, cp])
+        except IntegrityError:
+            devices.update(_load_devices(competition_id, [dev_num]))
+            if dev_num not in devices:
+                raise
+            device = devices[dev_num]
+        else:
+            devices[dev_num] = device
+            return cp, device, True, True
+
+    if device.checkpoint:
+        return device.checkpoint, device, False, False
+
+    cp = _placeholder_checkpoint(competition_id, dev_num, device)
     db.session.add(cp)
     db.session.flush()
-    created_checkpoint = True
-    return cp, device, created_device, created_checkpoint
+    return cp, device, False, True
 
 
 def _optional_int(payload: dict, key: str, *, positive: bool = False):
     raw = payload.get(key)
-    if raw in (None, ""):
+    if raw is None or raw == "":
         return None
-    try:
-        parsed = parse_int(raw, key)
-    except BadRequest as exc:
-        raise BadRequest(description=f"invalid {key}") from exc
+    if type(raw) is int:
+        # JSON bodies already carry ints; skip the coercion round-trip.
+        parsed = raw
+    else:
+        try:
+            parsed = parse_int(raw, key)
+        except BadRequest as exc:
+            raise BadRequest(description=f"invalid {key}") from exc
     if positive and parsed <= 0:
         raise BadRequest(description=f"{key} must be > 0")
     return parsed
@@ -87,14 +143,15 @@ def _optional_int(payload: dict, key: str, *, positive: bool = False):
 
 def _optional_float(payload: dict, key: str, *, minimum: float | None = None, maximum: float | None = None):
     raw = payload.get(key)
-    if raw in (None, ""):
+    if raw is None or raw == "":
         return None
-    try:
-        parsed = float(raw)
-    except (TypeError, ValueError) as exc:
-        raise BadRequest(description=f"invalid {key}") from exc
-    import math
-
+    if type(raw) is float:
+        parsed = raw
+    else:
+        try:
+            parsed = float(raw)
+        except (TypeError, ValueError) as exc:
+            raise BadRequest(description=f"invalid {key}") from exc
     if not math.isfinite(parsed):
         raise BadRequest(description=f"{key} must be a finite number")
     if minimum is not None and parsed < minimum:
@@ -104,33 +161,18 @@ def _optional_float(payload: dict, key: str, *, minimum: float | None = None, ma
     return parsed
 
 
-def _parse_ingest_payload() -> dict:
-    payload = request.get_json(force=True, silent=True)
-    if not isinstance(payload, dict):
-        payload = request.form.to_dict()
-    if not isinstance(payload, dict):
-        payload = {}
-
-    raw_competition_id = payload.get("competition_id")
-    if raw_competition_id in (None, ""):
-        raise BadRequest()
-
-    try:
-        competition_id = parse_int(raw_competition_id, "competition_id")
-    except BadRequest as exc:
-        raise BadRequest() from exc
-
+def _parse_message_fields(payload: dict) -> dict:
+    """Per-message fields shared by /api/ingest and each batch entry."""
     return {
-        "competition_id": competition_id,
         "dev_id": _optional_int(payload, "dev_id", positive=True),
         "checkpoint_id": _optional_int(payload, "checkpoint_id", positive=True),
         "payload": payload.get("payload"),
+        # Normalized once here so the batch card preload and the per-message
+        # lookup share it; a missing payload has no UID to look up.
+        "uid": _uid_from_payload(payload["payload"]) if payload.get("payload") is not None else "",
         "rssi": _optional_float(payload, "rssi"),
         "snr": _optional_float(payload, "snr"),
         "ts": _optional_int(payload, "ts"),
-        "source": payload.get("source"),
-        "ingest_password": payload.get("ingest_password"),
-        "password": payload.get("password"),
         "gps_lat": _optional_float(payload, "gps_lat", minimum=-90.0, maximum=90.0),
         "gps_lon": _optional_float(payload, "gps_lon", minimum=-180.0, maximum=180.0),
         # Altitude in metres - Mt. Everest is 8848, the deepest mine ~4000 below
@@ -140,6 +182,43 @@ def _parse_ingest_payload() -> dict:
     }
 
 
+def _request_body() -> dict:
+    # Gateways post JSON with or without a JSON Content-Type, so sniff the
+    # body once: an object goes straight to the JSON provider and only
+    # anything else pays for form parsing. A UTF-8 BOM is dropped first, as
+    # the stdlib decoder behind get_json(force=True) did.
+    raw = request.get_data().removeprefix(codecs.BOM_UTF8)
+    if raw.lstrip()[:1] == b"{":
+        try:
+            payload = current_app.json.loads(raw)
+        except ValueError:
+            payload = None
+        return payload if isinstance(payload, dict) else {}
+    return request.form.to_dict()
+
+
+def _parse_competition_id(payload: dict) -> int:
+    raw_competition_id = payload.get("competition_id")
+    if raw_competition_id in (None, ""):
+        raise BadRequest()
+
+    try:
+        return parse_int(raw_competition_id, "competition_id")
+    except BadRequest as exc:
+        raise BadRequest() from exc
+
+
+def _parse_ingest_payload() -> dict:
+    payload = _request_body()
+    return {
+        "competition_id": _parse_competition_id(payload),
+        **_parse_message_fields(payload),
+        "source": payload.get("source"),
+        "ingest_password": payload.get("ingest_password"),
+        "password": payload.get("password"),
+    }
+
+
 def _card_writeback(
     uid: str, dev_id: int, checkpoint: Checkpoint | None, team: Team | None, received_at: datetime
 ) -> dict | None:
@@ -181,11 +260,9 @@ def _ingest_member_can_bypass_secret(user, competition_id: int) -> bool:
     return (membership.role or "").strip().lower() in {"admin", "judge"}
 
 
-@ingest_api_bp.post("/api/ingest")
-def ingest_post():
-    args = _parse_ingest_payload()
-    competition_id = args["competition_id"]
-
+def _authorize_ingest(competition_id: int, ingest_password) -> tuple | None:
+    """Return an error response when the caller may not ingest into
+    competition_id, else None."""
     # Auth model:
     # - In dev (LORA_WEBHOOK_SECRET unset or "CHANGE_LATER") the endpoint is
     #   open. Production startup refuses to boot with the default value, so
@@ -197,27 +274,15 @@ def ingest_post():
     secret_configured = bool(expected_secret) and expected_secret != "CHANGE_LATER"
     if secret_configured:
         provided_secret = request.headers.get("X-Webhook-Secret", "")
-        secret_ok = hmac.compare_digest(provided_secret, expected_secret)
+        # Compare bytes: compare_digest raises TypeError on non-ASCII str,
+        # which turned a garbled header into a 500 instead of a 403.
+        secret_ok = hmac.compare_digest(provided_secret.encode(), expected_secret.encode())
         if not secret_ok and not _ingest_member_can_bypass_secret(current_user, competition_id):
             return {
                 "ok": False,
                 "error": "forbidden",
                 "detail": "Invalid webhook secret.",
             }, 403
-    dev_id = args.get("dev_id")
-    checkpoint_id = args.get("checkpoint_id")
-    payload = args.get("payload")
-    rssi = args.get("rssi")
-    snr = args.get("snr")
-    ts_unix = args.get("ts")
-    gps_lat = args.get("gps_lat")
-    gps_lon = args.get("gps_lon")
-    gps_alt = args.get("gps_alt")
-    gps_age = args.get("gps_age_ms")
-    ingest_password = args.get("ingest_password") or args.get("password")
-
-    received_at = utc_from_timestamp_naive(ts_unix) if ts_unix else utcnow_naive()
-
     competition = db.session.get(Competition, competition_id)
     if not competition:
         return {
@@ -241,6 +306,35 @@ def ingest_post():
             "detail": "Ingest password required.",
         }, 403
 
+    return None
+
+
+def _ingest_message(
+    competition_id: int,
+    args: dict,
+    *,
+    devices: dict[int, LoRaDevice] | None = None,
+    cards: dict[str, RFIDCard] | None = None,
+) -> tuple[dict, int]:
+    """Store one message and apply its side effects (device telemetry,
+    auto check-in). Returns (response body, status). Flushes but never
+    commits: the caller owns the transaction, so a batch commits once.
+
+    devices/cards are optional lookups preloaded by the batch endpoint;
+    without them each message loads its own."""
+    dev_id = args.get("dev_id")
+    checkpoint_id = args.get("checkpoint_id")
+    payload = args.get("payload")
+    rssi = args.get("rssi")
+    snr = args.get("snr")
+    ts_unix = args.get("ts")
+    gps_lat = args.get("gps_lat")
+    gps_lon = args.get("gps_lon")
+    gps_alt = args.get("gps_alt")
+    gps_age = args.get("gps_age_ms")
+
+    received_at = utc_from_timestamp_naive(ts_unix) if ts_unix else utcnow_naive()
+
     if dev_id is None and checkpoint_id is None:
         return {
             "ok": False,
@@ -282,195 +376,173 @@ def ingest_post():
     if dup:
         return {"ok": True, "message_id": dup.id, "duplicate": True}, 200
 
-    try:
-        # 1) Store raw message
-        msg = LoRaMessage(
+    cp = None
+    if dev_id is None:
+        cp = Checkpoint.query.filter(
+            Checkpoint.competition_id == competition_id,
+            Checkpoint.id == checkpoint_id,
+        ).first()
+        if not cp:
+            return {
+                "ok": False,
+                "error": "invalid_request",
+                "detail": "Invalid checkpoint_id.",
+            }, 400
+
+    # 1) Store raw message. Nothing reads the row back, so a plain
+    # INSERT ... RETURNING id skips building and tracking an ORM object.
+    raw_payload = str(payload)
+    message_id = db.session.execute(
+        insert(LoRaMessage)
+        .values(
             competition_id=competition_id,
             dev_id=dev_id_str,
-            payload=str(payload),
+            payload=raw_payload,
             rssi=float(rssi) if rssi is not None else None,
             snr=float(snr) if snr is not None else None,
             received_at=received_at,
         )
-        db.session.add(msg)
-
-        # 2) Update device telemetry + resolve checkpoint
-        cp = None
-        device = None
-        if dev_id is not None:
-            device = LoRaDevice.query.filter_by(competition_id=competition_id, dev_num=int(dev_id)).first()
-            if device:
-                device.last_seen = received_at
-                if rssi is not None:
-                    device.last_rssi = float(rssi)
-            cp, device, created_device, created_checkpoint = resolve_checkpoint_for_dev(competition_id, int(dev_id))
-            device.last_seen = received_at
-            if rssi is not None:
-                device.last_rssi = float(rssi)
-            if created_device:
-                record_audit_event(
+        .returning(LoRaMessage.id)
+    ).scalar_one()
+
+    # 2) Update device telemetry + resolve checkpoint
+    device = None
+    if dev_id is not None:
+        cp, device, created_device, created_checkpoint = resolve_checkpoint_for_dev(
+            competition_id, int(dev_id), devices
+        )
+        device.last_seen = received_at
+        if rssi is not None:
+            device.last_rssi = float(rssi)
+        if created_device:
+            record_audit_event(
+                competition_id=competition_id,
+                event_type="device_created",
+                entity_type="device",
+                entity_id=device.id,
+                actor_type="device",
+                actor_device=device,
+                summary=f"Device {format_device_label(device)} auto-created from ingest.",
+                details={"id": device.id, "dev_num": device.dev_num, "name": device.name, "source": "ingest"},
+                created_at=received_at,
+            )
+        if created_checkpoint:
+            invalidate_listing(competition_id)
+            record_audit_event(
+                competition_id=competition_id,
+                event_type="checkpoint_created",
+                entity_type="checkpoint",
+                entity_id=cp.id,
+                actor_type="device",
+                actor_device=device,
+                summary=f"Checkpoint {cp.name} auto-created from ingest.",
+                details={"id": cp.id, "name": cp.name, "lora_device_id": cp.lora_device_id, "source": "ingest"},
+                created_at=received_at,
+            )
+
+    # 3) Auto check-in if payload matches RFID UID. Scoped per
+    # competition so the same physical card can be reused across
+    # events without colliding.
+    uid = args.get("uid") or ""
+    if cards is None:
+        cards = _load_cards(competition_id, [uid])
+    card = cards.get(uid)
+
+    created_checkin = False
+    team_name = None
+    checkpoint_name = cp.name if cp else None
+    team_obj = None
+
+    if card:
+        team = card.team
+        if (
+            team
+            and cp
+            and team.competition_id == competition_id
+            and cp.competition_id == competition_id
+            and not cp.is_virtual
+        ):
+            team_obj = team
+            team_name = team.name
+            arrived_at = received_at
+            # One INSERT ... ON CONFLICT DO NOTHING instead of a SELECT
+            # followed by a guarded insert: uq_team_checkpoint settles a
+            # concurrent ingest for the same (team, checkpoint) inside
+            # the statement, and RETURNING only yields an id when this
+            # packet created the row. A conflict is a duplicate (200).
+            created_id = db.session.execute(
+                sqlite_insert(Checkin)
+                .values(
+                    team_id=team.id,
+                    checkpoint_id=cp.id,
                     competition_id=competition_id,
-                    event_type="device_created",
-                    entity_type="device",
-                    entity_id=device.id,
-                    actor_type="device",
-                    actor_device=device,
-                    summary=f"Device {format_device_label(device)} auto-created from ingest.",
-                    details={"id": device.id, "dev_num": device.dev_num, "name": device.name, "source": "ingest"},
-                    created_at=received_at,
+                    timestamp=received_at,
+                    created_by_device_id=device.id if device else None,
                 )
-            if created_checkpoint:
+                .on_conflict_do_nothing(index_elements=["team_id", "checkpoint_id"])
+                .returning(Checkin.id)
+            ).scalar_one_or_none()
+            if created_id is None:
+                existing_ts = (
+                    db.session.query(Checkin.timestamp)
+                    .filter_by(team_id=team.id, checkpoint_id=cp.id, competition_id=competition_id)
+                    .scalar()
+                )
+                arrived_at = existing_ts or received_at
+            else:
                 record_audit_event(
                     competition_id=competition_id,
-                    event_type="checkpoint_created",
-                    entity_type="checkpoint",
-                    entity_id=cp.id,
-                    actor_type="device",
+                    event_type="checkin_created",
+                    entity_type="checkin",
+                    entity_id=created_id,
+                    actor_type="device" if device else "system",
                     actor_device=device,
-                    summary=f"Checkpoint {cp.name} auto-created from ingest.",
-                    details={"id": cp.id, "name": cp.name, "lora_device_id": cp.lora_device_id, "source": "ingest"},
+                    summary=f"Check-in recorded for team {team.name} at {cp.name}.",
+                    details={
+                        "id": created_id,
+                        "team_id": team.id,
+                        "team_name": team.name,
+                        "checkpoint_id": cp.id,
+                        "checkpoint_name": cp.name,
+                        "timestamp": received_at.isoformat(),
+                        "source": "ingest",
+                    },
                     created_at=received_at,
                 )
-        elif checkpoint_id is not None:
-            cp = Checkpoint.query.filter(
-                Checkpoint.competition_id == competition_id,
-                Checkpoint.id == checkpoint_id,
-            ).first()
-            if not cp:
-                db.session.rollback()
-                return {
-                    "ok": False,
-                    "error": "invalid_request",
-                    "detail": "Invalid checkpoint_id.",
-                }, 400
-
-        # 3) Auto check-in if payload matches RFID UID. Scoped per
-        # competition so the same physical card can be reused across
-        # events without colliding.
-        #
-        # Some senders (v2 LoRa protocol) append "|<HMAC>" to the payload
-        # for offline tag verification; drop the suffix before lookup.
-        # Then normalize the same way /api/rfid/cards normalizes on write
-        # (strip ':' and '-', uppercase) so colon-separated NFC UIDs match
-        # the canonical DB form.
-        uid = normalize_uid(str(payload).split("|", 1)[0])
-        card = RFIDCard.query.filter_by(competition_id=competition_id, uid=uid).first()
-
-        created_checkin = False
-        team_name = None
-        checkpoint_name = cp.name if cp else None
-        team_obj = None
-
-        if card:
-            team = db.session.get(Team, card.team_id)
-            if (
-                team
-                and cp
-                and team.competition_id == competition_id
-                and cp.competition_id == competition_id
-                and not cp.is_virtual
-            ):
-                team_obj = team
-                team_name = team.name
-                arrived_at = received_at
-                exists = Checkin.query.filter_by(
-                    team_id=team.id,
-                    checkpoint_id=cp.id,
-                    competition_id=competition_id,
-                ).first()
-                if exists:
-                    arrived_at = exists.timestamp or received_at
-                else:
-                    # Use a SAVEPOINT around just the Checkin insert so a
-                    # concurrent ingest racing on the same (team, checkpoint)
-                    # hits the uq_team_checkpoint constraint cleanly: we roll
-                    # back just the savepoint, re-read the existing row, and
-                    # continue treating this packet as a duplicate (200).
-                    # The audit event lives outside the try/except so an
-                    # unrelated IntegrityError (from the audit insert or
-                    # anywhere else) is not misclassified as a duplicate.
-                    created = Checkin(
-                        team_id=team.id,
-                        checkpoint_id=cp.id,
-                        competition_id=competition_id,
-                        timestamp=received_at,
-                        created_by_device_id=device.id if device else None,
-                    )
-                    savepoint_ok = True
-                    try:
-                        with db.session.begin_nested():
-                            db.session.add(created)
-                    except IntegrityError:
-                        savepoint_ok = False
-                        existing = Checkin.query.filter_by(
-                            team_id=team.id,
-                            checkpoint_id=cp.id,
-                            competition_id=competition_id,
-                        ).first()
-                        if existing:
-                            arrived_at = existing.timestamp or received_at
-                    if savepoint_ok:
-                        record_audit_event(
-                            competition_id=competition_id,
-                            event_type="checkin_created",
-                            entity_type="checkin",
-                            entity_id=created.id,
-                            actor_type="device" if device else "system",
-                            actor_device=device,
-                            summary=f"Check-in recorded for team {team.name} at {cp.name}.",
-                            details={
-                                "id": created.id,
-                                "team_id": team.id,
-                                "team_name": team.name,
-                                "checkpoint_id": cp.id,
-                                "checkpoint_name": cp.name,
-                                "timestamp": received_at.isoformat(),
-                                "source": "ingest",
-                            },
-                            created_at=received_at,
-                        )
-                        created_checkin = True
-
-                try:
-                    mark_arrival_checkbox(team.id, cp.id, arrived_at)
-                except Exception:
-                    # do not fail ingest if Sheets update fails
-                    pass
-
-                # Timed segments are computed at read time from checkins
-                # and rendered in Sheets as formulas over the CP tabs'
-                # Time cells, so an arrival needs no extra recompute push
-                # here; the mark_arrival_checkbox write above already
-                # feeds every downstream surface.
-
-        # Skip writeback for non-UID payloads (GPS frames, comma-list data)
-        # AND for inputs whose shape doesn't match a real card UID. The old
-        # check only excluded GPS frames; manual judge entries through this
-        # endpoint would still flash a "writeback failed" UI message.
-        looks_like_uid = (
-            gps_lat is None
-            and gps_lon is None
-            and (payload is not None)
-            and ("," not in str(payload))
-            and looks_like_card_uid(uid)
-        )
-        if looks_like_uid:
-            digest_id = int(dev_id) if dev_id is not None else int(checkpoint_id or 0)
-            card_writeback = _card_writeback(uid, digest_id, cp, team_obj, received_at)
-
-        db.session.commit()
+                created_checkin = True
+
+            try:
+                mark_arrival_checkbox(team.id, cp.id, arrived_at)
+            except Exception:
+                # do not fail ingest if Sheets update fails
+                pass
+
+            # Timed segments are computed at read time from checkins
+            # and rendered in Sheets as formulas over the CP tabs'
+            # Time cells, so an arrival needs no extra recompute push
+            # here; the mark_arrival_checkbox write above already
+            # feeds every downstream surface.
+
+    # Skip writeback for non-UID payloads (GPS frames, comma-list data)
+    # AND for inputs whose shape doesn't match a real card UID. The old
+    # check only excluded GPS frames; manual judge entries through this
+    # endpoint would still flash a "writeback failed" UI message.
+    looks_like_uid = (
+        gps_lat is None
+        and gps_lon is None
+        and (payload is not None)
+        and ("," not in str(payload))
+        and looks_like_card_uid(uid)
+    )
+    if looks_like_uid:
+        digest_id = int(dev_id) if dev_id is not None else int(checkpoint_id or 0)
+        card_writeback = _card_writeback(uid, digest_id, cp, team_obj, received_at)
 
-    except SQLAlchemyError as e:
-        db.session.rollback()
-        return {
-            "ok": False,
-            "error": "database_error",
-            "detail": str(e.__class__.__name__),
-        }, 500
+    db.session.flush()
 
     resp = {
         "ok": True,
-        "message_id": msg.id,
+        "message_id": message_id,
         "dev_id": int(dev_id) if dev_id is not None else None,
         "uid_seen": bool(card),
         "team": team_name,
@@ -479,11 +551,93 @@ def ingest_post():
     }
 
     # Optional: include structured GPS if payload matches expected format
-    gps = parse_gps_payload(msg.payload)
+    gps = parse_gps_payload(raw_payload)
     if gps is not None:
         resp["gps"] = gps
     if card_writeback:
         resp["card_writeback"] = card_writeback
+    return resp, 201
 
-    headers = {"Location": f"/api/messages/{msg.id}"}  # optional future resource
+
+@ingest_api_bp.post("/api/ingest")
+def ingest_post():
+    args = _parse_ingest_payload()
+    competition_id = args["competition_id"]
+    denied = _authorize_ingest(competition_id, args.get("ingest_password") or args.get("password"))
+    if denied:
+        return denied
+
+    try:
+        resp, status = _ingest_message(competition_id, args)
+        if status == 201:
+            db.session.commit()
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        return {
+            "ok": False,
+            "error": "database_error",
+            "detail": str(e.__class__.__name__),
+        }, 500
+    if status != 201:
+        return resp, status
+
+    headers = {"Location": f"/api/messages/{resp['message_id']}"}  # optional future resource
     return resp, 201, headers
+
+
+@ingest_api_bp.post("/api/ingest/batch")
+def ingest_batch_post():
+    """Ingest a gateway burst in one transaction.
+
+    Body: {"competition_id", "messages": [...], "ingest_password"}; each
+    message takes the same fields as /api/ingest. Devices and cards the
+    batch refers to are loaded up front and everything is committed once,
+    instead of one commit (and fsync) per packet. Each entry gets the body
+    /api/ingest would have returned plus its "status".
+    """
+    body = _request_body()
+    competition_id = _parse_competition_id(body)
+    denied = _authorize_ingest(competition_id, body.get("ingest_password") or body.get("password"))
+    if denied:
+        return denied
+
+    items = body.get("messages")
+    if not isinstance(items, list) or not items:
+        return {
+            "ok": False,
+            "error": "invalid_request",
+            "detail": "Provide a non-empty 'messages' list.",
+        }, 400
+    if len(items) > INGEST_BATCH_MAX_MESSAGES:
+        return {
+            "ok": False,
+            "error": "invalid_request",
+            "detail": f"At most {INGEST_BATCH_MAX_MESSAGES} messages per batch.",
+        }, 400
+
+    results: list[dict | None] = [None] * len(items)
+    parsed: dict[int, dict] = {}
+    for idx, item in enumerate(items):
+        try:
+            if not isinstance(item, dict):
+                raise BadRequest(description="message must be an object")
+            parsed[idx] = _parse_message_fields(item)
+        except BadRequest as exc:
+            results[idx] = {"ok": False, "status": 400, "error": "invalid_request", "detail": exc.description}
+
+    try:
+        devices = _load_devices(competition_id, {a["dev_id"] for a in parsed.values() if a["dev_id"] is not None})
+        cards = _load_cards(competition_id, {a["uid"] for a in parsed.values()})
+        for idx, args in parsed.items():
+            resp, status = _ingest_message(competition_id, args, devices=devices, cards=cards)
+            results[idx] = {**resp, "status": status}
+        db.session.commit()
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        return {
+            "ok": False,
+            "error": "database_error",
+            "detail": str(e.__class__.__name__),
+        }, 500
+
+    return {"ok": True, "results": results}, 200
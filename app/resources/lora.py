@@ -168,7 +168,11 @@ def _update_device(device_id: int, partial: bool):
     comp_id = require_current_competition_id()
     if not comp_id:
         return jsonify({"error": "no_competition"}), 400
-    device = LoRaDevice.query.filter(LoRaDevice.competition_id == comp_id, LoRaDevice.id == device_id).first()
+    device = (
+        LoRaDevice.query.filter(LoRaDevice.competition_id == comp_id, LoRaDevice.id == device_id)
+        .options(joinedload(LoRaDevice.checkpoint))
+        .first()
+    )
     if not device:
         return jsonify({"error": "not_found"}), 404
     before = _device_snapshot(device)
@@ -230,7 +234,11 @@ def lora_device_delete(device_id: int):
     comp_id = require_current_competition_id()
     if not comp_id:
         return jsonify({"error": "no_competition"}), 400
-    device = LoRaDevice.query.filter(LoRaDevice.competition_id == comp_id, LoRaDevice.id == device_id).first()
+    device = (
+        LoRaDevice.query.filter(LoRaDevice.competition_id == comp_id, LoRaDevice.id == device_id)
+        .options(joinedload(LoRaDevice.checkpoint))
+        .first()
+    )
     if not device:
         return jsonify({"error": "not_found"}), 404
 
@@ -3,12 +3,16 @@ from __future__ import annotations
 
 import csv
 import io
+from collections.abc import Iterator
 
 from flask import Blueprint, jsonify, request
 from flask_babel import gettext as _
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import contains_eager
 
+from app.api.helpers import gzip_if_accepted
 from app.extensions import db
 from app.models import Checkin, Checkpoint, LoRaDevice, RFIDCard, Team
 from app.utils.card_tokens import match_digests
@@ -24,6 +28,31 @@ TIMEOUT = Config.SERIAL_TIMEOUT
 rfid_api_bp = Blueprint("api_rfid", __name__)
 
 
+def _card_import_upsert():
+    # Keyed on uq_rfid_competition_uid: a new UID inserts, a known one takes
+    # the row's team and number, so the import never has to pick a statement.
+    stmt = sqlite_insert(RFIDCard.__table__)
+    return stmt.on_conflict_do_update(
+        index_elements=["competition_id", "uid"],
+        set_={"team_id": stmt.excluded.team_id, "number": stmt.excluded.number},
+    )
+
+
+_CARD_IMPORT_UPSERT = _card_import_upsert()
+
+# Built once; each request only binds the competition. Six plain columns,
+# no ORM entities, in the shape _serialize_card produces.
+_CARD_LIST = (
+    select(RFIDCard.id, RFIDCard.uid, RFIDCard.number, Team.id, Team.name, Team.number)
+    .join(Team, RFIDCard.team_id == Team.id)
+    .where(RFIDCard.competition_id == bindparam("competition_id"))
+    .order_by(RFIDCard.number.asc().nulls_last(), RFIDCard.uid.asc())
+)
+
+# Import row fields, in the order the loop unpacks them.
+_IMPORT_COLUMNS = ("uid", "team_id", "team_name", "number")
+
+
 def _serialize_card(card: RFIDCard) -> dict:
     return {
         "id": card.id,
@@ -68,20 +97,49 @@ def _parse_card_payload(
     return uid, team_id, number, None
 
 
+def _team_in_competition(comp_id: int, team_id: int):
+    """team_id as a scalar subquery that is NULL unless the team is in this competition.
+
+    Written straight into the card row, so a foreign team trips the NOT NULL
+    constraint on rfid_cards.team_id instead of needing its own SELECT.
+    """
+    return select(Team.id).where(Team.id == team_id, Team.competition_id == comp_id).scalar_subquery()
+
+
+def _card_integrity_error(exc: IntegrityError, team_taken: str):
+    # rfid_cards.team_id is NOT NULL (foreign team, see above) and UNIQUE
+    # (one card per team); anything else is the per-competition UID.
+    message = str(exc.orig)
+    if "rfid_cards.team_id" in message:
+        if "UNIQUE" in message:
+            return jsonify({"error": "conflict", "detail": team_taken}), 409
+        return jsonify({"error": "validation_error", "detail": _("Invalid team_id")}), 400
+    return jsonify({"error": "conflict", "detail": _("UID already exists.")}), 409
+
+
 @rfid_api_bp.get("/api/rfid/cards")
 @json_login_required
 def rfid_card_list():
     comp_id = require_current_competition_id()
     if not comp_id:
         return jsonify({"error": "no_competition"}), 400
-    cards = (
-        RFIDCard.query.join(Team, RFIDCard.team_id == Team.id)
-        .filter(Team.competition_id == comp_id)
-        .options(joinedload(RFIDCard.team))
-        .order_by(RFIDCard.number.asc().nulls_last(), RFIDCard.uid.asc())
-        .all()
-    )
-    return {"cards": [_serialize_card(c) for c in cards]}, 200
+    rows = db.session.execute(_CARD_LIST, {"competition_id": comp_id})
+    cards = [
+        {
+            "id": card_id,
+            "uid": uid,
+            "number": number,
+            "team": {"id": team_id, "name": team_name, "number": team_number},
+        }
+        for card_id, uid, number, team_id, team_name, team_number in rows
+    ]
+    response = jsonify({"cards": cards})
+    # API clients re-fetch this list and it rarely changes. The ETag hashes
+    # the body (cards carry no updated_at, so count/max(id) would miss
+    # edits); no-cache makes every fetch revalidate rather than go stale.
+    response.add_etag()
+    response.headers["Cache-Control"] = "private, no-cache"
+    return gzip_if_accepted(response.make_conditional(request))
 
 
 @rfid_api_bp.post("/api/rfid/cards")
@@ -95,27 +153,18 @@ def rfid_card_create():
     if error:
         return jsonify({"error": "validation_error", "detail": error}), 400
 
-    team = (
-        Team.query.filter(Team.competition_id == comp_id, Team.id == team_id).first() if team_id is not None else None
+    card = RFIDCard(
+        competition_id=comp_id,
+        uid=uid,
+        team_id=_team_in_competition(comp_id, team_id) if team_id is not None else None,
+        number=number,
     )
-    if not team and team_id is not None:
-        return jsonify({"error": "validation_error", "detail": _("Invalid team_id")}), 400
-
-    if team and RFIDCard.query.filter_by(team_id=team.id).first():
-        return jsonify(
-            {
-                "error": "conflict",
-                "detail": _("This team already has an RFID card assigned."),
-            }
-        ), 409
-
-    card = RFIDCard(competition_id=comp_id, uid=uid, team_id=team_id, number=number)
     db.session.add(card)
     try:
         db.session.commit()
-    except IntegrityError:
+    except IntegrityError as exc:
         db.session.rollback()
-        return jsonify({"error": "conflict", "detail": _("UID already exists.")}), 409
+        return _card_integrity_error(exc, _("This team already has an RFID card assigned."))
 
     return {"ok": True, "card": _serialize_card(card)}, 201
 
@@ -129,7 +178,7 @@ def rfid_card_get(card_id: int):
     card = (
         RFIDCard.query.join(Team, RFIDCard.team_id == Team.id)
         .filter(Team.competition_id == comp_id, RFIDCard.id == card_id)
-        .options(joinedload(RFIDCard.team))
+        .options(contains_eager(RFIDCard.team))
         .first()
     )
     if not card:
@@ -161,28 +210,15 @@ def _update_card(card_id: int, partial: bool):
     if error:
         return jsonify({"error": "validation_error", "detail": error}), 400
 
-    if team_id is not None and not Team.query.filter(Team.competition_id == comp_id, Team.id == team_id).first():
-        return jsonify({"error": "validation_error", "detail": _("Invalid team_id")}), 400
-
-    if team_id is not None:
-        exists = RFIDCard.query.filter(RFIDCard.team_id == team_id, RFIDCard.id != card.id).first()
-        if exists:
-            return jsonify(
-                {
-                    "error": "conflict",
-                    "detail": _("That team already has an RFID card assigned."),
-                }
-            ), 409
-
     card.uid = uid
-    card.team_id = team_id
+    card.team_id = _team_in_competition(comp_id, team_id) if team_id is not None else None
     card.number = number
 
     try:
         db.session.commit()
-    except IntegrityError:
+    except IntegrityError as exc:
         db.session.rollback()
-        return jsonify({"error": "conflict", "detail": _("UID already exists.")}), 409
+        return _card_integrity_error(exc, _("That team already has an RFID card assigned."))
 
     return {"ok": True, "card": _serialize_card(card)}, 200
 
@@ -229,6 +265,27 @@ def rfid_scan():
     return {"ok": True, "uid": uid}, 200
 
 
+def _csv_import_rows(text) -> Iterator[tuple[str, ...]]:
+    # Header read once into column positions; each row is then indexed
+    # directly instead of being zipped into a dict as DictReader does.
+    reader = csv.reader(text)
+    columns = {name: i for i, name in enumerate(next(reader, None) or [])}
+    positions = [columns.get(name, -1) for name in _IMPORT_COLUMNS]
+    for row in reader:
+        if not row:
+            continue  # blank line, skipped as DictReader did
+        width = len(row)
+        yield tuple(row[i] if 0 <= i < width else "" for i in positions)
+
+
+def _json_import_rows(rows: list) -> Iterator[tuple[str, ...] | None]:
+    for row in rows:
+        if not isinstance(row, dict):
+            yield None
+            continue
+        yield tuple(row.get(name) or "" for name in _IMPORT_COLUMNS)
+
+
 @rfid_api_bp.post("/api/rfid/import")
 @json_roles_required("admin")
 def rfid_bulk_import():
@@ -239,105 +296,125 @@ def rfid_bulk_import():
     comp_id = require_current_competition_id()
     if not comp_id:
         return jsonify({"error": "no_competition"}), 400
-    rows = []
     if request.files.get("file"):
         file = request.files["file"]
-        try:
-            stream = io.StringIO(file.stream.read().decode("utf-8", errors="ignore"))
-            reader = csv.DictReader(stream)
-            rows = list(reader)
-        except Exception:
-            return jsonify({"error": "validation_error", "detail": "Invalid CSV upload."}), 400
+        # Decoded and parsed as the loop below consumes it, so only the
+        # current row is held as text rather than the whole upload twice.
+        rows = _csv_import_rows(io.TextIOWrapper(file.stream, encoding="utf-8", errors="ignore", newline=""))
     else:
         payload = request.get_json(silent=True) or {}
-        rows = payload.get("rows") or []
-        if not isinstance(rows, list):
+        json_rows = payload.get("rows") or []
+        if not isinstance(json_rows, list):
             return jsonify({"error": "validation_error", "detail": "rows must be a list."}), 400
+        rows = _json_import_rows(json_rows)
 
     created = updated = skipped = 0
     errors = []
 
-    for idx, row in enumerate(rows, start=1):
-        if not isinstance(row, dict):
-            skipped += 1
-            errors.append({"row": idx, "detail": "Row is not an object"})
-            continue
+    # One read of the competition's cards; rows are then validated against
+    # these maps, which track the import's own changes as it goes, and the
+    # writes are replayed in row order as one executemany upsert.
+    existing = db.session.execute(
+        select(RFIDCard.uid, RFIDCard.team_id).where(RFIDCard.competition_id == comp_id)
+    ).all()
+    team_by_uid = {uid: team_id for uid, team_id in existing}
+    uid_by_team = {team_id: uid for uid, team_id in existing}
+    # Same for teams: names match case-insensitively, first team by id wins,
+    # as the per-row ILIKE lookup used to.
+    team_ids: set[int] = set()
+    team_id_by_name: dict[str, int] = {}
+    for team_id, name in db.session.execute(
+        select(Team.id, Team.name).where(Team.competition_id == comp_id).order_by(Team.id)
+    ):
+        team_ids.add(team_id)
+        team_id_by_name.setdefault(name.lower(), team_id)
+    writes: list[dict] = []
 
-        uid_raw = (row.get("uid") or "").strip()
-        uid = normalize_uid(uid_raw)
-        if not uid:
-            skipped += 1
-            errors.append({"row": idx, "detail": "Missing uid"})
-            continue
-
-        team_id = None
-        team_name = (row.get("team_name") or "").strip()
-        team_id_val = (row.get("team_id") or "").strip()
-        if team_id_val:
-            try:
-                team_id = int(team_id_val)
-            except Exception:
-                errors.append({"row": idx, "detail": "Invalid team_id"})
+    try:
+        for idx, fields in enumerate(rows, start=1):
+            if fields is None:
                 skipped += 1
+                errors.append({"row": idx, "detail": "Row is not an object"})
                 continue
-        elif team_name:
-            team = Team.query.filter(Team.competition_id == comp_id, Team.name.ilike(team_name)).first()
-            if team:
-                team_id = team.id
-        if team_id and not Team.query.filter(Team.competition_id == comp_id, Team.id == team_id).first():
-            skipped += 1
-            errors.append({"row": idx, "detail": "Unknown team"})
-            continue
+            uid_raw, team_id_val, team_name, number_val = fields
 
-        number_val = (row.get("number") or "").strip()
-        number = None
-        if number_val:
-            try:
-                number = int(number_val)
-                if number <= 0:
-                    raise ValueError
-            except Exception:
+            # normalize_uid strips as well; no separate pass over the raw value.
+            uid = normalize_uid(uid_raw)
+            if not uid:
                 skipped += 1
-                errors.append({"row": idx, "detail": "Invalid number"})
+                errors.append({"row": idx, "detail": "Missing uid"})
                 continue
 
-        card = RFIDCard.query.filter_by(competition_id=comp_id, uid=uid).first()
-        is_new = False
-        if not card:
-            if not team_id:
+            team_id = None
+            team_name = team_name.strip()
+            team_id_val = team_id_val.strip()
+            if team_id_val:
+                try:
+                    team_id = int(team_id_val)
+                except Exception:
+                    errors.append({"row": idx, "detail": "Invalid team_id"})
+                    skipped += 1
+                    continue
+            elif team_name:
+                team_id = team_id_by_name.get(team_name.lower())
+            if team_id and team_id not in team_ids:
                 skipped += 1
-                errors.append({"row": idx, "detail": "Missing team_id or team_name"})
+                errors.append({"row": idx, "detail": "Unknown team"})
                 continue
-            card = RFIDCard(competition_id=comp_id, uid=uid)
-            is_new = True
 
-        if team_id:
-            with db.session.no_autoflush:
-                conflict = RFIDCard.query.filter(RFIDCard.team_id == team_id, RFIDCard.id != card.id).first()
-            if conflict:
+            number_val = number_val.strip()
+            number = None
+            if number_val:
+                # Plain digit cells skip the try/except; anything else still
+                # goes through int(), so '+5' and '1_0' import as before.
+                if number_val.isdecimal():
+                    number = int(number_val)
+                else:
+                    try:
+                        number = int(number_val)
+                    except ValueError:
+                        number = 0
+                if number <= 0:
+                    skipped += 1
+                    errors.append({"row": idx, "detail": "Invalid number"})
+                    continue
+
+            is_new = uid not in team_by_uid
+            if is_new and not team_id:
                 skipped += 1
-                errors.append({"row": idx, "detail": "Team already has a card"})
-                db.session.rollback()
+                errors.append({"row": idx, "detail": "Missing team_id or team_name"})
                 continue
-            card.team_id = team_id
-        card.number = number
-        if is_new:
-            db.session.add(card)
-
-        try:
-            db.session.flush()
-        except IntegrityError:
-            db.session.rollback()
-            skipped += 1
-            errors.append({"row": idx, "detail": "UID already exists"})
-            continue
 
-        if is_new:
-            created += 1
-        else:
-            updated += 1
+            if team_id:
+                holder = uid_by_team.get(team_id)
+                if holder is not None and holder != uid:
+                    skipped += 1
+                    errors.append({"row": idx, "detail": "Team already has a card"})
+                    continue
+                if not is_new:
+                    uid_by_team.pop(team_by_uid[uid], None)
+                team_by_uid[uid] = team_id
+                uid_by_team[team_id] = uid
+
+            writes.append({"competition_id": comp_id, "uid": uid, "team_id": team_by_uid[uid], "number": number})
+            if is_new:
+                created += 1
+            else:
+                updated += 1
+    except csv.Error:
+        # Malformed CSV (e.g. an oversized field) only surfaces mid-stream;
+        # nothing has been written yet.
+        return jsonify({"error": "validation_error", "detail": "Invalid CSV upload."}), 400
 
-    db.session.commit()
+    try:
+        if writes:
+            db.session.execute(_CARD_IMPORT_UPSERT, writes)
+        db.session.commit()
+    except IntegrityError:
+        # Only a concurrent edit can get here; the checks above mirror
+        # every constraint on rfid_cards.
+        db.session.rollback()
+        return jsonify({"error": "conflict", "detail": "Cards changed during import; nothing was saved."}), 409
 
     return {
         "ok": True,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import hmac
+import re
 from collections.abc import Iterable
 
 from flask import current_app
@@ -24,7 +25,7 @@ def _settings() -> tuple[str, int]:
 # previous behaviour returned a writeback dict for those, which made the
 # UI flash "Card write-back failed" against teams that were never scanned.
 _VALID_UID_LENGTHS = frozenset({8, 10, 14, 16, 20})
-_HEX_CHARS = frozenset("0123456789ABCDEF")
+_HEX_UID_RE = re.compile(r"[0-9A-F]+")
 
 
 def looks_like_card_uid(uid: str | None) -> bool:
@@ -35,7 +36,7 @@ def looks_like_card_uid(uid: str | None) -> bool:
     s = uid.strip().upper()
     if len(s) not in _VALID_UID_LENGTHS:
         return False
-    return all(c in _HEX_CHARS for c in s)
+    return _HEX_UID_RE.fullmatch(s) is not None
 
 
 def compute_card_digest(uid: str, dev_id: int) -> str | None:
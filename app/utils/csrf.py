@@ -9,6 +9,7 @@ _CSRF_SESSION_KEY = "_csrf_token"
 _SAFE_METHODS = {"GET", "HEAD", "OPTIONS", "TRACE"}
 _EXEMPT_PATHS = {
     "/api/ingest",
+    "/api/ingest/batch",
     "/api/auth/login",
 }
 
@@ -39,9 +39,13 @@ def api_request(
     with current_app.test_client() as client:
         base_url = _base_url()
         server_name = _server_name()
-        with client.session_transaction(base_url=base_url) as nested_session:
-            nested_session.clear()
-            nested_session.update(session)
+        # The browser's session cookie is copied below and overrides any
+        # cookie session_transaction would set, so only pay for building and
+        # signing a session here when the request arrived without one.
+        if current_app.config["SESSION_COOKIE_NAME"] not in request.cookies:
+            with client.session_transaction(base_url=base_url) as nested_session:
+                nested_session.clear()
+                nested_session.update(session)
         for name, value in request.cookies.items():
             client.set_cookie(name, value, domain=server_name, path="/")
 
@@ -0,0 +1,52 @@
+# app/utils/json_provider.py
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+# Datetimes go through Flask's `default` hook so their wire format stays the
+# same as the stdlib provider produced; everything else orjson handles natively.
+_BASE_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+# orjson parses integers outside the 64-bit range as floats instead of failing,
+# so any payload with a 19+ digit run (which covers negatives below int64 min)
+# is decoded by the stdlib to stay exact.
+_WIDE_INT = re.compile(rb"-?\d{19,}")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for compact responses and request bodies.
+
+    Indented output (debug mode, explicit `indent=`), values orjson refuses
+    and request bodies it would round (ints outside the 64-bit range, NaN
+    literals) fall back to the stdlib provider. Two output differences from
+    `DefaultJSONProvider` remain: NaN and infinities are written as `null`,
+    and non-ASCII text is emitted as UTF-8 rather than `\\u` escapes
+    (`ensure_ascii` is ignored), which decodes to the same strings.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs.get("indent") is not None or kwargs.get("cls") is not None:
+            return super().dumps(obj, **kwargs)
+
+        option = _BASE_OPTIONS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=kwargs.get("default", self.default), option=option).decode()
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        if _WIDE_INT.search(s.encode() if isinstance(s, str) else s):
+            return super().loads(s)
+        try:
+            return orjson.loads(s)
+        except json.JSONDecodeError:
+            return super().loads(s)
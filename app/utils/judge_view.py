@@ -11,6 +11,10 @@ PathStop.expected_leg_minutes, otherwise only "last seen" is shown.
 
 from __future__ import annotations
 
+from collections import defaultdict
+
+from sqlalchemy import select
+
 from app.extensions import db
 from app.models import (
     Checkin,
@@ -87,20 +91,21 @@ def build_judge_checkpoint_view(comp_id: int, checkpoint_id: int) -> dict:
     # standing there" arrived list would be empty.
     route_cp_ids = {cid for route in group_routes.values() for cid in route}
     route_cp_ids.add(checkpoint_id)
-    team_cp_times: dict[int, dict[int, object]] = {}
+    team_cp_times: dict[int, dict[int, object]] = defaultdict(dict)
     if route_cp_ids:
-        checkins = (
-            Checkin.query.filter(
+        checkins = db.session.execute(
+            select(Checkin.team_id, Checkin.checkpoint_id, Checkin.timestamp)
+            .where(
                 Checkin.competition_id == comp_id,
                 Checkin.checkpoint_id.in_(route_cp_ids),
             )
             .order_by(Checkin.timestamp.asc())
-            .all()
         )
-        for checkin in checkins:
-            team_cp_times.setdefault(checkin.team_id, {}).setdefault(
-                checkin.checkpoint_id, checkin.timestamp
-            )
+        # Ascending order: the first row per (team, checkpoint) is the arrival.
+        for checkin_team_id, checkin_cp_id, checkin_ts in checkins:
+            arrivals = team_cp_times[checkin_team_id]
+            if checkin_cp_id not in arrivals:
+                arrivals[checkin_cp_id] = checkin_ts
 
     # Latest score entry per team at this checkpoint (scored/unscored badge).
     latest_entry: dict[int, ScoreEntry] = {}
@@ -110,7 +115,7 @@ def build_judge_checkpoint_view(comp_id: int, checkpoint_id: int) -> dict:
             ScoreEntry.checkpoint_id == checkpoint_id,
         )
         .order_by(ScoreEntry.created_at.desc())
-        .all()
+        .yield_per(500)
     ):
         latest_entry.setdefault(entry.team_id, entry)
 
@@ -0,0 +1,37 @@
+# app/utils/listing_cache.py
+from __future__ import annotations
+
+import time
+
+from flask import current_app
+
+# The check-in list re-renders its team/checkpoint filter dropdowns on every
+# filter change; reuse the API result briefly instead of re-querying each hit.
+LISTING_CACHE_SECONDS = 5.0
+
+LISTING_KEYS = ("teams", "checkpoints")
+
+
+def _listing_cache() -> dict[tuple[int | None, str], tuple[float, list[dict]]]:
+    # Per-app like the LoRa device list cache; every team and checkpoint write
+    # invalidates it, and the TTL bounds anything that slips past.
+    return current_app.extensions.setdefault("checkins_listing_cache", {})
+
+
+def get_cached_listing(competition_id: int | None, key: str) -> list[dict] | None:
+    """Return the cached listing if it is younger than LISTING_CACHE_SECONDS."""
+    hit = _listing_cache().get((competition_id, key))
+    if hit and time.monotonic() - hit[0] < LISTING_CACHE_SECONDS:
+        return hit[1]
+    return None
+
+
+def store_listing(competition_id: int | None, key: str, items: list[dict]) -> None:
+    _listing_cache()[(competition_id, key)] = (time.monotonic(), items)
+
+
+def invalidate_listing(competition_id: int | None) -> None:
+    """Drop a competition's cached team and checkpoint listings."""
+    cache = _listing_cache()
+    for key in LISTING_KEYS:
+        cache.pop((competition_id, key), None)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from datetime import datetime
 
 from sqlalchemy.orm import joinedload
@@ -214,12 +215,14 @@ def build_live_arrivals(comp_id: int, group_id: int | None = None, sort: str = "
             )
         checkins = checkins_query.order_by(Checkin.timestamp.asc(), Checkin.id.asc()).all()
 
-    team_cp_times: dict[int, dict[int, datetime]] = {team_id: {} for team_id in team_ids}
+    team_cp_times: dict[int, dict[int, datetime]] = defaultdict(dict)
     latest_by_team: dict[int, Checkin] = {}
     latest_by_checkpoint: dict[int, Checkin] = {}
     arrived_team_ids_by_checkpoint: dict[int, set[int]] = {}
     for checkin in checkins:
-        team_cp_times.setdefault(checkin.team_id, {}).setdefault(checkin.checkpoint_id, checkin.timestamp)
+        arrivals = team_cp_times[checkin.team_id]
+        if checkin.checkpoint_id not in arrivals:
+            arrivals[checkin.checkpoint_id] = checkin.timestamp
         latest_by_team[checkin.team_id] = checkin
         latest_by_checkpoint[checkin.checkpoint_id] = checkin
         arrived_team_ids_by_checkpoint.setdefault(checkin.checkpoint_id, set()).add(checkin.team_id)
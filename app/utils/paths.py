@@ -103,19 +103,35 @@ def replace_path_stops(
     existing values are kept for positions whose checkpoint did not
     change, so a pure reorder of later stops doesn't wipe leg estimates.
     """
+    # Update rows in place by position instead of clearing and re-inserting:
+    # an unchanged path writes nothing, and an edit only touches the stops
+    # that moved. Positions stay dense, so (path_id, position) never collides.
     previous = {stop.position: stop for stop in path.stops}
-    path.stops = []
-    db.session.flush()
+    existing = list(path.stops)
+    if any(stop.position != idx for idx, stop in enumerate(existing)):
+        # Gapped positions (older imports) can't be shifted row by row
+        # without tripping the unique constraint mid-flush; rebuild instead.
+        path.stops = []
+        db.session.flush()
+        existing = []
     for position, checkpoint_id in enumerate(ordered_checkpoint_ids):
+        old = previous.get(position)
         if expected_minutes is not None:
             minutes = expected_minutes[position] if position < len(expected_minutes) else None
         else:
-            old = previous.get(position)
             minutes = old.expected_leg_minutes if (old and old.checkpoint_id == checkpoint_id) else None
-        path.stops.append(
-            PathStop(
-                checkpoint_id=checkpoint_id,
-                position=position,
-                expected_leg_minutes=minutes,
+        if position >= len(existing):
+            path.stops.append(
+                PathStop(
+                    checkpoint_id=checkpoint_id,
+                    position=position,
+                    expected_leg_minutes=minutes,
+                )
             )
-        )
+            continue
+        if old.checkpoint_id != checkpoint_id:
+            old.checkpoint_id = checkpoint_id
+        if old.expected_leg_minutes != minutes:
+            old.expected_leg_minutes = minutes
+    for stale in existing[len(ordered_checkpoint_ids) :]:
+        path.stops.remove(stale)
@@ -1,7 +1,7 @@
 # app/utils/perms.py
 from functools import wraps
 
-from flask import abort, current_app, redirect, request, url_for
+from flask import abort, current_app, g, redirect, request, session, url_for
 from flask_login import current_user
 
 from app.utils.competition import get_current_competition_role
@@ -15,7 +15,16 @@ def _current_role_set():
     field is reserved for the system-level "superadmin" role, which is
     handled as an explicit bypass below. Doing the union allowed roles to
     leak across competitions (e.g. an admin in one comp passing admin
-    gates in another)."""
+    gates in another).
+
+    Memoized on `g` for the request: roles_required and every has_role()
+    call in the templates would otherwise repeat the membership queries.
+    The key includes the selected competition so switching it mid-request
+    recomputes."""
+    cached = g.get("_role_set_cache")
+    if cached and cached[0] == (current_user.get_id(), session.get("competition_id")):
+        return cached[1]
+
     roles = set()
     comp_role = (get_current_competition_role() or "").strip().lower()
     if comp_role:
@@ -25,6 +34,10 @@ def _current_role_set():
     global_role = (getattr(current_user, "role", None) or "").strip().lower()
     if global_role == "superadmin":
         roles.update({"superadmin", "admin", "judge", "viewer"})
+    roles = frozenset(roles)
+    # Keyed after the lookup: get_current_competition_id() may have just
+    # stored a fallback competition in the session.
+    g._role_set_cache = ((current_user.get_id(), session.get("competition_id")), roles)
     return roles
 
 
@@ -11,7 +11,7 @@ from __future__ import annotations
 import math
 from datetime import datetime
 
-from sqlalchemy import func
+from sqlalchemy import func, select
 
 from app.extensions import db
 from app.models import (
@@ -283,6 +283,40 @@ def compute_segment_results(comp_id: int, team_ids: list[int], segment: dict) ->
 # ---------------------------------------------------------------------------
 
 
+def get_dead_time_totals(
+    comp_id: int, team_ids: list[int], allowed_checkpoint_ids: set[int] | None = None
+) -> dict[int, float]:
+    """get_team_dead_time_total for several teams in two queries."""
+    if not team_ids:
+        return {}
+    entries = db.session.execute(
+        select(ScoreEntry.team_id, ScoreEntry.checkpoint_id, ScoreEntry.raw_fields)
+        .where(ScoreEntry.competition_id == comp_id, ScoreEntry.team_id.in_(team_ids))
+        .order_by(ScoreEntry.created_at.desc())
+        .execution_options(yield_per=500)
+    )
+    latest_raw: dict[tuple[int, int], dict | None] = {}
+    for team_id, checkpoint_id, raw_fields in entries:
+        if allowed_checkpoint_ids is not None and checkpoint_id not in allowed_checkpoint_ids:
+            continue
+        latest_raw.setdefault((team_id, checkpoint_id), raw_fields)
+    totals = dict.fromkeys(team_ids, 0.0)
+    for (team_id, _checkpoint_id), raw_fields in latest_raw.items():
+        raw = raw_fields or {}
+        num = _to_number(raw.get("dead_time", raw.get("Dead Time")))
+        if num is not None and num > 0:
+            totals[team_id] += num
+    for team_id, bonus in db.session.execute(
+        select(Team.id, Team.bonus_dead_time).where(Team.id.in_(team_ids))
+    ):
+        if bonus:
+            try:
+                totals[team_id] += float(bonus)
+            except (TypeError, ValueError):
+                pass
+    return totals
+
+
 def get_team_dead_time_total(
     comp_id: int, team_id: int, allowed_checkpoint_ids: set[int] | None = None
 ) -> float:
@@ -292,33 +326,7 @@ def get_team_dead_time_total(
     (compute_group_contrib passes the group's route), matching the
     leaderboard's Dead time column: an entry left on an off-route
     checkpoint must not shrink the team's race elapsed time."""
-    entries = (
-        ScoreEntry.query.filter(
-            ScoreEntry.competition_id == comp_id,
-            ScoreEntry.team_id == team_id,
-        )
-        .order_by(ScoreEntry.created_at.desc())
-        .all()
-    )
-    latest_by_cp: dict[int, ScoreEntry] = {}
-    for entry in entries:
-        if allowed_checkpoint_ids is not None and entry.checkpoint_id not in allowed_checkpoint_ids:
-            continue
-        if entry.checkpoint_id not in latest_by_cp:
-            latest_by_cp[entry.checkpoint_id] = entry
-    total_dead = 0.0
-    for entry in latest_by_cp.values():
-        raw = entry.raw_fields or {}
-        num = _to_number(raw.get("dead_time", raw.get("Dead Time")))
-        if num is not None and num > 0:
-            total_dead += num
-    team = db.session.get(Team, team_id)
-    if team and team.bonus_dead_time:
-        try:
-            total_dead += float(team.bonus_dead_time)
-        except (TypeError, ValueError):
-            pass
-    return total_dead
+    return get_dead_time_totals(comp_id, [team_id], allowed_checkpoint_ids)[team_id]
 
 
 def compute_group_contrib(comp_id: int, team_id: int, group: CheckpointGroup | None) -> dict:
@@ -330,42 +338,49 @@ def compute_group_contrib(comp_id: int, team_id: int, group: CheckpointGroup | N
     floor(over / penalty_minutes) * penalty_points, floored at min_points.
     dq_multiplier over threshold auto-DNFs.
     """
+    return compute_group_contribs(comp_id, [team_id], group)[team_id]
+
+
+def compute_group_contribs(comp_id: int, team_ids: list[int], group: CheckpointGroup | None) -> dict[int, dict]:
+    """compute_group_contrib for every team in one category.
+
+    The route and rule are resolved once and found counts, start/finish
+    times and dead time are each one grouped query over the pool, so the
+    leaderboard costs a fixed number of queries per category, not per team.
+    """
     scoring: GroupScoring | None = group.scoring if group else None
     if not scoring:
-        return {"total": None, "found_points": None, "time_points": None, "auto_dnf": False}
-
-    total = 0.0
-    used = False
-    found_points = None
-    time_points = None
-    auto_dnf = False
+        return {
+            team_id: {"total": None, "found_points": None, "time_points": None, "auto_dnf": False}
+            for team_id in team_ids
+        }
 
-    route = resolve_route_ids(group)
+    route = resolve_route_ids(group) if team_ids else []
 
     points_per = _to_number(scoring.found_points_per)
+    found_by_team: dict[int, int] | None = None
     if points_per is not None and route:
         distinct_route = list(dict.fromkeys(route))
-        eligible = {
-            cp_id
-            for (cp_id,) in db.session.query(Checkpoint.id).filter(
-                Checkpoint.id.in_(distinct_route),
-                Checkpoint.counts_for_found.is_(True),
+        eligible = set(
+            db.session.scalars(
+                select(Checkpoint.id).where(
+                    Checkpoint.id.in_(distinct_route),
+                    Checkpoint.counts_for_found.is_(True),
+                )
             )
-        }
+        )
         if eligible:
-            found = (
-                Checkin.query.filter(
-                    Checkin.competition_id == comp_id,
-                    Checkin.team_id == team_id,
-                    Checkin.checkpoint_id.in_(eligible),
-                )
-                .with_entities(Checkin.checkpoint_id)
-                .distinct()
-                .count()
+            found_by_team = dict(
+                db.session.execute(
+                    select(Checkin.team_id, func.count(Checkin.checkpoint_id.distinct()))
+                    .where(
+                        Checkin.competition_id == comp_id,
+                        Checkin.team_id.in_(team_ids),
+                        Checkin.checkpoint_id.in_(eligible),
+                    )
+                    .group_by(Checkin.team_id)
+                ).all()
             )
-            found_points = _round_score(points_per * found)
-            total += found_points
-            used = True
 
     max_points = _to_number(scoring.race_max_points)
     threshold = _to_number(scoring.race_threshold_minutes)
@@ -373,27 +388,45 @@ def compute_group_contrib(comp_id: int, team_id: int, group: CheckpointGroup | N
     penalty_points = _to_number(scoring.race_penalty_points)
     min_points = _to_number(scoring.race_min_points) or 0.0
     dq_multiplier = _to_number(scoring.race_dq_multiplier)
-    if (
+    race_rule = bool(
         route
         and max_points is not None
         and threshold is not None
         and penalty_minutes
         and penalty_points is not None
-    ):
-        start_map = _first_checkin_times(comp_id, [team_id], route[0])
-        end_map = _first_checkin_times(comp_id, [team_id], route[-1])
-        start_ts = start_map.get(team_id)
-        end_ts = end_map.get(team_id)
+    )
+    durations: dict[int, float] = {}
+    if race_rule:
+        start_map = _first_checkin_times(comp_id, team_ids, route[0])
+        end_map = _first_checkin_times(comp_id, team_ids, route[-1])
         # end >= start mirrors compute_segment_results: a finish check-in
         # BEFORE the start (a stray early scan at the finish station) is
         # an invalid pair, not a 0-minute run - clamping it to 0 would
         # award full max points for walking past the finish at the start.
-        if start_ts and end_ts and end_ts >= start_ts:
-            raw_duration = (end_ts - start_ts).total_seconds() / 60.0
-            dead_total = get_team_dead_time_total(
-                comp_id, team_id, allowed_checkpoint_ids=set(route)
-            )
-            duration = max(0.0, raw_duration - dead_total)
+        for team_id in team_ids:
+            start_ts = start_map.get(team_id)
+            end_ts = end_map.get(team_id)
+            if start_ts and end_ts and end_ts >= start_ts:
+                durations[team_id] = (end_ts - start_ts).total_seconds() / 60.0
+        dead_totals = get_dead_time_totals(comp_id, list(durations), allowed_checkpoint_ids=set(route))
+        for team_id, raw_duration in durations.items():
+            durations[team_id] = max(0.0, raw_duration - dead_totals[team_id])
+
+    results: dict[int, dict] = {}
+    for team_id in team_ids:
+        total = 0.0
+        used = False
+        found_points = None
+        time_points = None
+        auto_dnf = False
+
+        if found_by_team is not None:
+            found_points = _round_score(points_per * found_by_team.get(team_id, 0))
+            total += found_points
+            used = True
+
+        duration = durations.get(team_id)
+        if duration is not None:
             if dq_multiplier is not None and dq_multiplier > 0 and duration > threshold * dq_multiplier:
                 auto_dnf = True
             if duration <= threshold:
@@ -405,12 +438,13 @@ def compute_group_contrib(comp_id: int, team_id: int, group: CheckpointGroup | N
             total += time_points
             used = True
 
-    return {
-        "total": (_round_score(total) if used else None),
-        "found_points": found_points,
-        "time_points": time_points,
-        "auto_dnf": auto_dnf,
-    }
+        results[team_id] = {
+            "total": (_round_score(total) if used else None),
+            "found_points": found_points,
+            "time_points": time_points,
+            "auto_dnf": auto_dnf,
+        }
+    return results
 
 
 def segment_end_checkpoint_ids(comp_id: int) -> set[int]:
@@ -1,14 +1,19 @@
 import re
+import time
 
 from serial.tools import list_ports
 
 import serial
 
+# Separators NFC readers put between UID bytes; dropped in one translate pass.
+_UID_SEPARATORS = str.maketrans("", "", ":-")
+_UID_TOKEN = re.compile(r"[0-9A-Fa-f:\-]{6,}")
+
 
 def normalize_uid(uid: str) -> str:
     if not uid:
         return ""
-    return uid.replace(":", "").replace("-", "").strip().upper()
+    return uid.translate(_UID_SEPARATORS).strip().upper()
 
 
 def find_serial_port(hint: str = "") -> str | None:
@@ -31,12 +36,19 @@ def read_uid_once(baudrate: int, hint: str, timeout: float) -> str | None:
     port = find_serial_port(hint)
     if not port:
         return None
+    deadline = time.monotonic() + timeout
     try:
         with serial.Serial(port, baudrate, timeout=timeout) as ser:
+            # A blank line (bare CRLF between reader frames) doesn't end the
+            # scan; keep reading until the overall deadline.
             line = ser.readline().decode("utf-8", errors="ignore").strip()
-            if not line:
-                return None
-            tokens = re.findall(r"[0-9A-Fa-f:\-]{6,}", line)
+            while not line:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                ser.timeout = remaining
+                line = ser.readline().decode("utf-8", errors="ignore").strip()
+            tokens = _UID_TOKEN.findall(line)
             candidate = max(tokens, key=len) if tokens else line
             return normalize_uid(candidate)
     except Exception:
@@ -2182,9 +2182,11 @@ def _build_local_cp_grid(
                     .order_by(ScoreEntry.created_at.desc())
                     .first()
                 )
-                ci = Checkin.query.filter_by(competition_id=competition_id, team_id=t_id, checkpoint_id=cp_id).first()
-                if ci and ci.timestamp:
-                    checkin_ts = ci.timestamp
+                checkin_ts = (
+                    db.session.query(Checkin.timestamp)
+                    .filter_by(competition_id=competition_id, team_id=t_id, checkpoint_id=cp_id)
+                    .scalar()
+                )
             rows.append(
                 {
                     "team_id": t_id,
@@ -1,6 +1,8 @@
 # app/utils/status.py
 from __future__ import annotations
 
+from sqlalchemy import select
+
 from app.extensions import db
 from app.models import Checkin, Checkpoint, CheckpointGroup, TeamGroup
 
@@ -42,12 +44,12 @@ def get_group_checkpoints(group: CheckpointGroup) -> list[Checkpoint]:
 
 def get_found_checkpoint_ids(team_id: int, competition_id: int) -> list[int]:
     """Return checkpoint IDs that the team has already checked in at."""
-    rows = (
-        db.session.query(Checkin.checkpoint_id)
-        .filter(Checkin.team_id == team_id, Checkin.competition_id == competition_id)
-        .all()
-    )
-    return [cp_id for (cp_id,) in rows]
+    return db.session.scalars(
+        select(Checkin.checkpoint_id).where(
+            Checkin.team_id == team_id,
+            Checkin.competition_id == competition_id,
+        )
+    ).all()
 
 
 def compute_team_statuses(team_id: int, competition_id: int) -> dict:
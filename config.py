@@ -19,6 +19,16 @@ class Config:
     # Only read DATABASE_URL from env; if missing, app factory will set a proper sqlite path
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Per-process connection pool (each gunicorn worker has its own).
+    # Requests check a pooled connection out instead of reconnecting and
+    # re-running the connect-time PRAGMAs; applied in create_app for
+    # file-backed databases.
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    # Development/CI guard: list and export queries that declare their eager
+    # loads raise on any other lazy relationship access instead of quietly
+    # issuing one SELECT per row.
+    RAISELOAD_GUARD = _env_bool("RAISELOAD_GUARD", False)
 
     # i18n
     LANGUAGES = {"en": "English", "sl": "Slovenščina"}
@@ -32,6 +42,12 @@ class Config:
     # MAX_CONTENT_LENGTH_MB env var.
     MAX_CONTENT_LENGTH = int(os.getenv("MAX_CONTENT_LENGTH_MB", "32")) * 1024 * 1024
 
+    # How long anonymous /scores/public pages (results and stats) may reuse
+    # a context built for an earlier viewer. New score entries and check-ins
+    # bypass it at once; edits to existing rows show up once it lapses.
+    # 0 disables.
+    PUBLIC_RESULTS_CACHE_SECONDS = float(os.getenv("PUBLIC_RESULTS_CACHE_SECONDS", "10"))
+
     # App settings
     _WEBHOOK_SECRET_ENV = os.getenv("LORA_WEBHOOK_SECRET")
     if (not _WEBHOOK_SECRET_ENV or _WEBHOOK_SECRET_ENV == "CHANGE_LATER") and os.getenv("FLASK_ENV") == "production":
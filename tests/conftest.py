@@ -27,6 +27,7 @@ def build_test_config(tmp_path: Path) -> dict:
         "BABEL_DEFAULT_LOCALE": "en",
         "LORA_WEBHOOK_SECRET": "CHANGE_LATER",
         "SHEETS_SYNC_ENABLED": False,
+        "RAISELOAD_GUARD": True,
         # Run Sheets writes inline so tests observe the side effects directly.
         # The durable outbox dispatch is exercised separately in
         # test_sheets_outbox.
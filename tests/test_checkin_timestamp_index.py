@@ -0,0 +1,38 @@
+"""Verify the composite index behind check-in date-range filtering.
+
+Check-in lists and exports filter on competition_id plus a half-open
+timestamp range and order newest first. The (competition_id, timestamp)
+index lets SQLite seek the range and walk it in order instead of
+filtering every competition row and sorting afterwards.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import inspect, select, text
+
+from app.extensions import db
+from app.models import Checkin
+
+
+def test_checkins_competition_timestamp_index_exists(app):
+    by_name = {ix["name"]: ix for ix in inspect(db.engine).get_indexes("checkins")}
+    assert "ix_checkins_competition_timestamp" in by_name, sorted(by_name)
+    assert by_name["ix_checkins_competition_timestamp"]["column_names"] == ["competition_id", "timestamp"]
+
+
+def test_checkin_date_range_query_uses_index_without_sort(app):
+    stmt = (
+        select(Checkin.id)
+        .where(
+            Checkin.competition_id == 1,
+            Checkin.timestamp >= datetime(2026, 1, 1),
+            Checkin.timestamp < datetime(2026, 2, 1),
+        )
+        .order_by(Checkin.timestamp.desc())
+    )
+    sql = str(stmt.compile(db.engine, compile_kwargs={"literal_binds": True}))
+    plan = [row[-1] for row in db.session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+    assert any("ix_checkins_competition_timestamp" in step for step in plan), plan
+    assert not any("TEMP B-TREE" in step for step in plan), plan
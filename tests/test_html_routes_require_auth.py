@@ -9,6 +9,18 @@ UX is correct."""
 
 from __future__ import annotations
 
+from datetime import datetime
+
+from tests.support import (
+    add_membership,
+    create_checkin,
+    create_checkpoint,
+    create_competition,
+    create_team,
+    create_user,
+    login_as,
+)
+
 
 def _is_login_redirect(resp) -> bool:
     """Flask-Login emits 302 to the configured login view with the
@@ -57,3 +69,36 @@ def test_main_view_checkins_redirects_anonymous_user(client):
     assert _is_login_redirect(resp), (
         f"expected a redirect to login, got {resp.status_code}"
     )
+
+
+def test_main_view_checkins_forwards_to_checkins_list(client, app):
+    """The legacy /checkins path no longer renders its own copy of the
+    list; a signed-in user lands on /checkins/ with the filters intact."""
+    user = create_user(username="legacy-checkins-user")
+    competition = create_competition(name="Legacy Checkins Race")
+    add_membership(user, competition, role="admin")
+    login_as(client, user, competition)
+
+    resp = client.get("/checkins?team_id=3", follow_redirects=False)
+    assert resp.status_code == 302
+    assert resp.headers["Location"].endswith("/checkins/?team_id=3")
+
+
+def test_main_checkins_csv_streams_rows_for_signed_in_user(client, app):
+    """The streamed export still carries the header and one line per
+    check-in, with formula-looking names neutralised."""
+    user = create_user(username="legacy-csv-user")
+    competition = create_competition(name="Legacy CSV Race")
+    add_membership(user, competition, role="admin")
+    team = create_team(competition, name="=Wolves")
+    checkpoint = create_checkpoint(competition, name="Summit")
+    create_checkin(competition, team, checkpoint, timestamp=datetime(2026, 5, 1, 9, 30, 15, 250000))
+    login_as(client, user, competition)
+
+    resp = client.get("/checkins.csv")
+    lines = resp.get_data(as_text=True).splitlines()
+    assert resp.status_code == 200
+    assert lines[0] == "timestamp_utc,team_id,team_name,checkpoint_id,checkpoint_name"
+    assert len(lines) == 2
+    assert lines[1].startswith("2026-05-01 09:30:15,")
+    assert "'=Wolves" in lines[1]
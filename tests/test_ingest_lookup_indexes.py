@@ -0,0 +1,45 @@
+"""Verify the per-packet /api/ingest lookups are index seeks, not table scans.
+
+Each packet resolves its device by (competition_id, dev_num), its card by
+(competition_id, uid) and its check-in by (team_id, checkpoint_id). The
+competition-scoped unique constraints on those tables already provide the
+indexes; these tests pin the query plans so a schema change can't silently
+turn a lookup into a scan that grows with race traffic.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import select, text
+
+from app.extensions import db
+from app.models import Checkin, LoRaDevice, RFIDCard
+
+
+def _query_plan(stmt) -> list[str]:
+    sql = str(stmt.compile(db.engine, compile_kwargs={"literal_binds": True}))
+    return [row[-1] for row in db.session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+
+
+def _assert_index_seek(stmt, table: str) -> None:
+    plan = _query_plan(stmt)
+    assert any(step.startswith(f"SEARCH {table} USING") for step in plan), plan
+    assert not any(step.startswith(f"SCAN {table}") for step in plan), plan
+
+
+def test_device_lookup_uses_competition_dev_num_index(app):
+    stmt = select(LoRaDevice).where(LoRaDevice.competition_id == 1, LoRaDevice.dev_num.in_([7, 8]))
+    _assert_index_seek(stmt, "lora_devices")
+
+
+def test_card_lookup_uses_competition_uid_index(app):
+    stmt = select(RFIDCard).where(RFIDCard.competition_id == 1, RFIDCard.uid.in_(["CAFECAFE"]))
+    _assert_index_seek(stmt, "rfid_cards")
+
+
+def test_checkin_lookup_uses_team_checkpoint_index(app):
+    stmt = select(Checkin.timestamp).where(
+        Checkin.team_id == 1,
+        Checkin.checkpoint_id == 2,
+        Checkin.competition_id == 1,
+    )
+    _assert_index_seek(stmt, "checkins")
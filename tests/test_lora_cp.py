@@ -1,13 +1,27 @@
 from __future__ import annotations
 
 import time
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import pytest
+from flask import request
 from sqlalchemy.exc import IntegrityError
 
 from app.extensions import db
-from app.models import Checkin, Checkpoint, Competition, CompetitionMember, LoRaDevice, RFIDCard, Team
+from app.models import (
+    Checkin,
+    Checkpoint,
+    Competition,
+    CompetitionInvite,
+    CompetitionMember,
+    JudgeCheckpoint,
+    LoRaDevice,
+    LoRaMessage,
+    RFIDCard,
+    Team,
+)
+from app.utils.competition import create_invite
 from app.utils.time import utcnow_naive
 from tests.support import (
     add_membership,
@@ -103,6 +117,22 @@ class TestConfigAndFactory:
         assert db_path.name == "app.db"
         assert "instance" not in db_path.parts
 
+    def test_create_app_pools_file_database_connections(self, app_factory):
+        application = app_factory(DB_POOL_SIZE=7)
+        with application.app_context():
+            pool = db.engine.pool
+        assert application.config["SQLALCHEMY_ENGINE_OPTIONS"]["pool_size"] == 7
+        assert pool.size() == 7
+
+    def test_json_provider_matches_stdlib_output(self, app):
+        with app.app_context():
+            body = app.json.dumps({"b": 1, "a": datetime(2024, 1, 2, 3, 4, 5)}, separators=(",", ":"))
+            assert body == '{"a":"Tue, 02 Jan 2024 03:04:05 GMT","b":1}'
+            assert app.json.loads(b'{"big": 18446744073709551617}') == {"big": 2**64 + 1}
+            assert app.json.loads(b'{"n": -9223372036854775809}') == {"n": -(2**63) - 1}
+        with app.test_request_context(data=b'{"n": -9223372036854775809}', content_type="application/json"):
+            assert request.get_json() == {"n": -(2**63) - 1}
+
 
 class TestAuthApi:
     def test_login_with_username(self, client, app):
@@ -271,6 +301,31 @@ class TestIngestApi:
         checkin = Checkin.query.filter_by(team_id=team.id, checkpoint_id=checkpoint.id).one()
         assert checkin.created_by_device_id == device.id
 
+    def test_ingest_accepts_untyped_json_bom_json_and_form_bodies(self, client, app):
+        competition = create_competition(name="Body Sniff Race")
+        device = create_device(competition, dev_num=3, name="Gateway 3")
+        create_checkpoint(competition, name="CP-3", lora_device=device)
+
+        as_text = client.post(
+            "/api/ingest",
+            data=f'{{"competition_id": {competition.id}, "dev_id": 3, "payload": "hello"}}',
+            content_type="text/plain",
+        )
+        with_bom = client.post(
+            "/api/ingest",
+            data=f'\ufeff{{"competition_id": {competition.id}, "dev_id": 3, "payload": "bom"}}'.encode(),
+            content_type="application/json",
+        )
+        as_form = client.post(
+            "/api/ingest",
+            data={"competition_id": str(competition.id), "dev_id": "3", "payload": "world"},
+        )
+
+        assert as_text.status_code == 201
+        assert with_bom.status_code == 201
+        assert as_form.status_code == 201
+        assert LoRaMessage.query.filter_by(competition_id=competition.id).count() == 3
+
     def test_ingest_is_idempotent_for_same_team_and_checkpoint(self, client, app):
         competition = create_competition(name="Idempotent Race")
         device = create_device(competition, dev_num=2, name="Gateway 2")
@@ -360,6 +415,44 @@ class TestIngestApi:
         assert response.status_code == 404
         assert response.get_json()["error"] == "not_found"
 
+    def test_ingest_batch_reports_each_message(self, client, app):
+        competition = create_competition(name="Batch Race")
+        device = create_device(competition, dev_num=3, name="Gateway 3")
+        checkpoint = create_checkpoint(competition, name="CP-3", lora_device=device)
+        team = create_team(competition, name="Hawks", number=7)
+        create_rfid_card(team, uid="C1D2E3F4")
+
+        response = client.post(
+            "/api/ingest/batch",
+            json={
+                "competition_id": competition.id,
+                "messages": [
+                    {"dev_id": 3, "payload": "C1D2E3F4", "rssi": -70},
+                    {"dev_id": 44, "payload": "UNKNOWN"},
+                    {"dev_id": 45, "payload": "UNKNOWN"},
+                    {"dev_id": 3, "payload": "C1D2E3F4", "ts": int(time.time()) + 15},
+                    {"payload": "NO-TARGET"},
+                    {"dev_id": "abc", "payload": "BAD"},
+                ],
+            },
+        )
+        body = response.get_json()
+        results = body["results"]
+
+        assert response.status_code == 200
+        assert [r["status"] for r in results] == [201, 201, 201, 201, 400, 400]
+        assert results[0]["checkin_created"] is True
+        assert results[3]["checkin_created"] is False
+        assert Checkin.query.filter_by(team_id=team.id, checkpoint_id=checkpoint.id).count() == 1
+        assert LoRaDevice.query.filter_by(competition_id=competition.id, dev_num=44).count() == 1
+        assert LoRaMessage.query.filter_by(competition_id=competition.id).count() == 4
+
+    def test_ingest_batch_rejects_empty_messages(self, client, app):
+        competition = create_competition(name="Empty Batch Race")
+        response = client.post("/api/ingest/batch", json={"competition_id": competition.id, "messages": []})
+        assert response.status_code == 400
+        assert response.get_json()["error"] == "invalid_request"
+
 
 class TestDeviceApi:
     def test_devices_alias_lists_current_competition_devices(self, client, app):
@@ -469,6 +562,22 @@ class TestHtmlFlows:
         assert deleted.status_code == 200
         assert db.session.get(RFIDCard, card.id) is None
 
+    def test_rfid_add_reports_invalid_number_instead_of_dropping_it(self, client, app):
+        user = create_user(username="rfid-number-admin")
+        competition = create_competition(name="RFID Number Race")
+        add_membership(user, competition, role="admin")
+        login_as(client, user, competition)
+        team = create_team(competition, name="Number Card Team", number=4)
+
+        rejected = client.post("/rfid/add", data={"uid": "BEEFBEEF", "team_id": str(team.id), "number": "1.5"})
+        blank = client.post("/rfid/add", data={"uid": "BEEFBEEF", "team_id": str(team.id), "number": " "})
+
+        assert rejected.status_code == 200
+        assert b"number must be integer" in rejected.data
+        assert b'value="1.5"' in rejected.data
+        assert blank.status_code == 302
+        assert RFIDCard.query.filter_by(uid="BEEFBEEF").one().number is None
+
     def test_lora_add_and_delete_routes(self, client, app):
         user = create_user(username="device-admin")
         competition = create_competition(name="LoRa HTML Race")
@@ -487,6 +596,33 @@ class TestHtmlFlows:
         assert deleted.status_code == 200
         assert db.session.get(LoRaDevice, device.id) is None
 
+    def test_lora_list_cache_is_invalidated_by_add(self, client, app):
+        user = create_user(username="device-lister")
+        competition = create_competition(name="LoRa List Race")
+        add_membership(user, competition, role="admin")
+        login_as(client, user, competition)
+
+        before = client.get("/lora/")
+        client.post("/lora/add", data={"dev_num": "11", "name": "Fresh Gateway", "active": "on"})
+        after = client.get("/lora/")
+
+        assert b"Fresh Gateway" not in before.data
+        assert b"Fresh Gateway" in after.data
+
+    def test_lora_edit_route_saves_and_handles_missing_device(self, client, app):
+        user = create_user(username="device-editor")
+        competition = create_competition(name="LoRa Edit Race")
+        add_membership(user, competition, role="admin")
+        login_as(client, user, competition)
+        device = create_device(competition, dev_num=8, name="Old")
+
+        updated = client.post(f"/lora/{device.id}/edit", data={"dev_num": "8", "name": "New", "active": "on"})
+        missing = client.post("/lora/999999/edit", data={"dev_num": "9"})
+
+        assert updated.status_code == 302
+        assert db.session.get(LoRaDevice, device.id).name == "New"
+        assert missing.status_code == 302
+
     def test_checkpoint_add_edit_delete_routes(self, client, app):
         user = create_user(username="checkpoint-admin")
         competition = create_competition(name="Checkpoint HTML Race")
@@ -563,6 +699,97 @@ class TestHtmlFlows:
         assert deleted.status_code == 200
         assert db.session.get(Checkin, checkin.id) is None
 
+    def test_checkins_list_filters_show_teams_and_checkpoints_created_after_caching(self, client, app):
+        user = create_user(username="checkin-filter-admin")
+        competition = create_competition(name="Checkin Filter Race")
+        add_membership(user, competition, role="admin")
+        login_as(client, user, competition)
+        create_team(competition, name="Early Team", number=1)
+
+        client.get("/checkins/")
+        client.post("/teams/add", data={"name": "Late Team", "number": "2"})
+        client.post("/checkpoints/add", data={"name": "Late Point"})
+        listed = client.get("/checkins/")
+        client.post("/api/ingest", json={"competition_id": competition.id, "dev_id": 9, "payload": "hi"})
+        after_ingest = client.get("/checkins/")
+
+        assert b"Early Team" in listed.data
+        assert b"Late Team" in listed.data
+        assert b"Late Point" in listed.data
+        assert b"Device 9" in after_ingest.data
+
+    def test_competition_settings_lists_invite_statuses(self, client, app):
+        user = create_user(username="invite-admin")
+        competition = create_competition(name="Invite Status Race")
+        add_membership(user, competition, role="admin")
+        login_as(client, user, competition)
+        used = create_invite(competition.id, user.id, invited_email="used@example.com")
+        used.used_at = utcnow_naive()
+        expired = create_invite(competition.id, user.id, invited_email="expired@example.com")
+        expired.expires_at = utcnow_naive() - timedelta(hours=1)
+        create_invite(competition.id, user.id, invited_email="pending@example.com")
+        db.session.commit()
+
+        page = client.get("/competition/settings").get_data(as_text=True)
+
+        for email, badge in (
+            ("used@example.com", "Used"),
+            ("expired@example.com", "Expired"),
+            ("pending@example.com", "Pending"),
+        ):
+            row = page[page.index(email) :].split("</tr>", 1)[0]
+            assert f">{badge}</span>" in row
+
+    def test_competition_invite_matches_existing_user_email_exactly(self, client, app):
+        admin = create_user(username="invite-exact-admin")
+        create_user(username="lookalike", email="abc@example.com")
+        competition = create_competition(name="Invite Exact Race")
+        add_membership(admin, competition, role="admin")
+        login_as(client, admin, competition)
+
+        client.post("/competition/settings", data={"action": "invite", "invite_email": "a_c@example.com"})
+        client.post("/competition/settings", data={"action": "invite", "invite_email": "ABC@Example.com"})
+
+        invites = {inv.invited_email: inv for inv in CompetitionInvite.query.filter_by(competition_id=competition.id)}
+        assert invites["a_c@example.com"].used_at is None
+        assert invites["abc@example.com"].used_at is not None
+
+    def test_competition_invite_attaches_users_without_touching_existing_roles(self, client, app):
+        admin = create_user(username="invite-attach-admin")
+        newcomer = create_user(username="newcomer", email="newcomer@example.com")
+        member = create_user(username="member", email="member@example.com")
+        competition = create_competition(name="Invite Attach Race")
+        add_membership(admin, competition, role="admin")
+        add_membership(member, competition, role="admin")
+        login_as(client, admin, competition)
+
+        for email in ("newcomer@example.com", "member@example.com", "stranger@example.com", "stranger@example.com"):
+            client.post(
+                "/competition/settings", data={"action": "invite", "invite_email": email, "invite_role": "viewer"}
+            )
+
+        roles = {m.user_id: m.role for m in CompetitionMember.query.filter_by(competition_id=competition.id)}
+        assert roles[newcomer.id] == "viewer"
+        assert roles[member.id] == "admin"
+        assert CompetitionInvite.query.filter_by(invited_email="stranger@example.com").count() == 1
+
+    def test_revoke_invite_only_deletes_current_competition_invites(self, client, app):
+        admin = create_user(username="invite-revoke-admin")
+        competition = create_competition(name="Invite Revoke Race")
+        other = create_competition(name="Invite Revoke Other Race")
+        add_membership(admin, competition, role="admin")
+        own = create_invite(competition.id, admin.id, invited_email="own@example.com")
+        foreign = create_invite(other.id, admin.id, invited_email="foreign@example.com")
+        own_id, foreign_id = own.id, foreign.id
+        db.session.commit()
+        login_as(client, admin, competition)
+
+        client.post(f"/competition/invites/{own_id}/revoke")
+        client.post(f"/competition/invites/{foreign_id}/revoke")
+
+        assert db.session.get(CompetitionInvite, own_id) is None
+        assert db.session.get(CompetitionInvite, foreign_id) is not None
+
     def test_judge_assignment_route(self, client, app):
         admin = create_user(username="judge-admin")
         judge = create_user(username="judge-user")
@@ -588,6 +815,28 @@ class TestHtmlFlows:
         assert console.status_code == 200
         assert b"Judge Gate" in console.data
 
+    def test_judge_reassignment_replaces_rows_and_default(self, client, app):
+        admin = create_user(username="reassign-admin")
+        judge = create_user(username="reassign-judge")
+        competition = create_competition(name="Reassign Race")
+        add_membership(admin, competition, role="admin")
+        add_membership(judge, competition, role="judge")
+        cp1, cp2, cp3 = (create_checkpoint(competition, name=f"Reassign {i}") for i in range(1, 4))
+        login_as(client, admin, competition)
+
+        for ids, default in (([cp1.id, cp2.id], cp2.id), ([cp2.id, cp3.id], cp3.id)):
+            client.post(
+                "/judges/assign",
+                data={
+                    "judge_id": str(judge.id),
+                    "checkpoint_ids": [str(cid) for cid in ids],
+                    "default_checkpoint_id": str(default),
+                },
+            )
+
+        rows = JudgeCheckpoint.query.filter_by(user_id=judge.id).order_by(JudgeCheckpoint.checkpoint_id).all()
+        assert [(jc.checkpoint_id, jc.is_default) for jc in rows] == [(cp2.id, False), (cp3.id, True)]
+
     def test_finish_console_route(self, client, app):
         user = create_user(username="finish-judge")
         competition = create_competition(name="Finish Race")
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import csv
+import gzip
 import importlib
+import io
+import json
 from datetime import timedelta
 from types import SimpleNamespace
 
 import pytest
 
 from app.extensions import db
-from app.models import Checkin, LoRaMessage
+from app.models import Checkin, LoRaMessage, RFIDCard
 from app.utils import serial_helpers, sheets_sync
 from app.utils.card_tokens import compute_card_digest, match_digests
 from app.utils.time import utcnow_naive
@@ -80,6 +83,27 @@ class TestSerialHelpers:
 
         assert serial_helpers.read_uid_once(9600, "rfid", 1.0) == "AABBCCDD"
 
+    def test_read_uid_once_skips_blank_lines_until_deadline(self, monkeypatch):
+        lines = iter([b"\r\n", b"", b"04:A3:1B:22\r\n"])
+
+        class FakeSerial:
+            def __init__(self, port, baudrate, timeout):
+                self.timeout = timeout
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, exc_type, exc, tb):
+                return False
+
+            def readline(self):
+                return next(lines)
+
+        monkeypatch.setattr(serial_helpers, "find_serial_port", lambda hint="": "/dev/ttyUSB0")
+        monkeypatch.setattr(serial_helpers.serial, "Serial", FakeSerial)
+
+        assert serial_helpers.read_uid_once(9600, "rfid", 5.0) == "04A31B22"
+
 
 class TestConfigHardening:
     def test_default_secret_key_is_dev_only(self, monkeypatch):
@@ -251,6 +275,20 @@ class TestWebhookSecurity:
 
         assert response.status_code == 403
 
+    def test_ingest_rejects_non_ascii_webhook_secret_header(self, app_factory):
+        application = app_factory(LORA_WEBHOOK_SECRET="webhook-secret")
+        client = application.test_client()
+        with application.app_context():
+            competition_id = create_competition(name="Webhook Race 3").id
+
+        response = client.post(
+            "/api/ingest",
+            json={"competition_id": competition_id, "dev_id": 1, "payload": "AABBCCDD"},
+            headers={"X-Webhook-Secret": "s\u00e9cret"},
+        )
+
+        assert response.status_code == 403
+
     def test_ingest_accepts_correct_webhook_secret_header(self, app_factory):
         application = app_factory(LORA_WEBHOOK_SECRET="webhook-secret")
         client = application.test_client()
@@ -874,6 +912,44 @@ class TestGroupsAndSheets:
 
         assert response.status_code == 200
 
+    def test_active_group_api_rejects_missing_team_and_bad_groups(self, client, app):
+        admin = create_user(username="active-group-admin")
+        competition = create_competition(name="Active Group Race")
+        add_membership(admin, competition, role="admin")
+        login_as(client, admin, competition)
+        team = create_team(competition, name="Switching Team", number=3)
+        foreign = create_group(create_competition(name="Other Group Race"), name="Foreign")
+
+        missing_team = client.post("/api/teams/999999/active-group", json={"group_id": foreign.id})
+        missing_group = client.post(f"/api/teams/{team.id}/active-group", json={"group_id": 999999})
+        other_comp = client.post(f"/api/teams/{team.id}/active-group", json={"group_id": foreign.id})
+
+        assert missing_team.status_code == 404
+        assert missing_group.status_code == 400
+        assert missing_group.get_json()["detail"] == "Invalid group"
+        assert other_comp.status_code == 400
+        assert other_comp.get_json()["detail"] == "Invalid group for this competition"
+
+    def test_group_list_revalidates_with_etag(self, client, app):
+        admin = create_user(username="group-etag-admin")
+        competition = create_competition(name="Group ETag Race")
+        add_membership(admin, competition, role="admin")
+        login_as(client, admin, competition)
+        create_group(competition, name="Juniors")
+
+        first = client.get("/groups/")
+        etag = first.headers.get("ETag")
+        repeat = client.get("/groups/", headers={"If-None-Match": etag})
+        create_group(competition, name="Seniors")
+        changed = client.get("/groups/", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert etag
+        assert "no-cache" in first.headers["Cache-Control"]
+        assert repeat.status_code == 304
+        assert changed.status_code == 200
+        assert b"Seniors" in changed.data
+
     def test_sheets_page_is_stable_when_sync_is_disabled(self, client, app):
         admin = create_user(username="sheets-admin")
         competition = create_competition(name="Sheets Race")
@@ -1153,3 +1229,279 @@ class TestRfidPut:
 
         assert response.status_code == 404
         assert body["error"] == "not_found"
+
+    def test_rfid_put_rejects_team_from_another_competition(self, client, app):
+        admin = create_user(username="rfid-put-foreign-admin")
+        competition = create_competition(name="RFID PUT Home Race")
+        other = create_competition(name="RFID PUT Away Race")
+        add_membership(admin, competition, role="admin")
+        login_as(client, admin, competition)
+
+        team = create_team(competition, name="Home Card Team", number=1)
+        foreign = create_team(other, name="Away Card Team", number=1)
+        card = create_rfid_card(team, uid="HOMECARD", number=3)
+
+        response = client.put(f"/api/rfid/cards/{card.id}", json={"uid": "HOMECARD", "team_id": foreign.id})
+        body = response.get_json()
+
+        assert response.status_code == 400
+        assert body["detail"] == "Invalid team_id"
+        assert db.session.get(RFIDCard, card.id).team_id == team.id
+
+
+class TestRfidCreate:
+    def test_rfid_create_rejects_unknown_and_foreign_teams(self, client, app):
+        admin = create_user(username="rfid-create-admin")
+        competition = create_competition(name="RFID Create Race")
+        other = create_competition(name="RFID Create Other Race")
+        add_membership(admin, competition, role="admin")
+        login_as(client, admin, competition)
+
+        team = create_team(competition, name="Create Card Team", number=1)
+        foreign = create_team(other, name="Foreign Card Team", number=1)
+
+        for team_id in (foreign.id, 999999):
+            response = client.post("/api/rfid/cards", json={"uid": "NEWCARD", "team_id": team_id})
+            assert response.status_code == 400
+            assert response.get_json()["detail"] == "Invalid team_id"
+
+        created = client.post("/api/rfid/cards", json={"uid": "NEWCARD", "team_id": team.id, "number": 4})
+        body = created.get_json()
+
+        assert created.status_code == 201
+        assert body["card"]["team"] == {"id": team.id, "name": "Create Card Team", "number": 1}
+        assert RFIDCard.query.count() == 1
+
+    def test_rfid_create_and_update_reject_a_second_card_for_a_team(self, client, app):
+        admin = create_user(username="rfid-team-taken-admin")
+        competition = create_competition(name="RFID Team Taken Race")
+        add_membership(admin, competition, role="admin")
+        login_as(client, admin, competition)
+
+        first = create_team(competition, name="Carded Team", number=1)
+        second = create_team(competition, name="Other Carded Team", number=2)
+        create_rfid_card(first, uid="FIRSTCARD", number=1)
+        card = create_rfid_card(second, uid="SECONDCARD", number=2)
+
+        created = client.post("/api/rfid/cards", json={"uid": "THIRDCARD", "team_id": first.id})
+        moved = client.patch(f"/api/rfid/cards/{card.id}", json={"team_id": first.id})
+        kept = client.patch(f"/api/rfid/cards/{card.id}", json={"team_id": second.id, "number": 7})
+
+        assert created.status_code == 409
+        assert created.get_json()["detail"] == "This team already has an RFID card assigned."
+        assert moved.status_code == 409
+        assert moved.get_json()["detail"] == "That team already has an RFID card assigned."
+        assert kept.status_code == 200
+        assert kept.get_json()["card"]["number"] == 7
+
+
+class TestRfidImport:
+    def test_rfid_import_applies_rows_in_order_and_keeps_earlier_rows_on_conflict(self, client, app):
+        admin = create_user(username="rfid-import-admin")
+        competition = create_competition(name="RFID Import Race")
+        add_membership(admin, competition, role="admin")
+        login_as(client, admin, competition)
+        first = create_team(competition, name="Import One", number=1)
+        second = create_team(competition, name="Import Two", number=2)
+        third = create_team(competition, name="Import Three", number=3)
+        create_rfid_card(first, uid="OLDCARD1")
+
+        response = client.post(
+            "/api/rfid/import",
+            json={
+                "rows": [
+                    {"uid": "OLDCARD1", "team_id": str(second.id), "number": "7"},
+                    {"uid": "NEWCARD1", "team_id": str(first.id)},
+                    {"uid": "NEWCARD2", "team_id": str(third.id)},
+                    {"uid": "NEWCARD2", "number": "5"},
+                ]
+            },
+        )
+        body = response.get_json()
+
+        assert response.status_code == 200
+        assert body["summary"] == {"created": 2, "updated": 2, "skipped": 0}
+        cards = {
+            card.uid: (card.team_id, card.number) for card in RFIDCard.query.filter_by(competition_id=competition.id)
+        }
+        assert cards == {
+            "OLDCARD1": (second.id, 7),
+            "NEWCARD1": (first.id, None),
+            "NEWCARD2": (third.id, 5),
+        }
+
+    def test_rfid_import_rejects_non_positive_or_non_numeric_numbers(self, client, app):
+        admin = create_user(username="rfid-import-number-admin")
+        competition = create_competition(name="RFID Import Number Race")
+        add_membership(admin, competition, role="admin")
+        login_as(client, admin, competition)
+        team = create_team(competition, name="Numbered Team", number=1)
+
+        response = client.post(
+            "/api/rfid/import",
+            json={
+                "rows": [
+                    {"uid": "NUMCARD", "team_id": str(team.id), "number": value}
+                    for value in ("0", "-2", "x1", "²", " 12 ")
+                ]
+            },
+        )
+        body = response.get_json()
+
+        assert body["summary"] == {"created": 1, "updated": 0, "skipped": 4}
+        assert [error["detail"] for error in body["errors"]] == ["Invalid number"] * 4
+        assert RFIDCard.query.filter_by(uid="NUMCARD").one().number == 12
+
+    def test_rfid_import_accepts_signed_and_underscored_numbers(self, client, app):
+        admin = create_user(username="rfid-import-int-syntax-admin")
+        competition = create_competition(name="RFID Import Int Syntax Race")
+        add_membership(admin, competition, role="admin")
+        login_as(client, admin, competition)
+        first = create_team(competition, name="Signed Team", number=1)
+        second = create_team(competition, name="Underscored Team", number=2)
+
+        response = client.post(
+            "/api/rfid/import",
+            json={
+                "rows": [
+                    {"uid": "SIGNCARD", "team_id": str(first.id), "number": "+5"},
+                    {"uid": "UNDERCARD", "team_id": str(second.id), "number": "1_0"},
+                ]
+            },
+        )
+
+        assert response.get_json()["summary"] == {"created": 2, "updated": 0, "skipped": 0}
+        assert RFIDCard.query.filter_by(uid="SIGNCARD").one().number == 5
+        assert RFIDCard.query.filter_by(uid="UNDERCARD").one().number == 10
+
+    def test_rfid_import_skips_team_conflicts_without_dropping_other_rows(self, client, app):
+        admin = create_user(username="rfid-import-conflict-admin")
+        competition = create_competition(name="RFID Import Conflict Race")
+        add_membership(admin, competition, role="admin")
+        login_as(client, admin, competition)
+        taken = create_team(competition, name="Taken Team", number=1)
+        free = create_team(competition, name="Free Team", number=2)
+        create_rfid_card(taken, uid="HOLDER01")
+
+        response = client.post(
+            "/api/rfid/import",
+            json={
+                "rows": [
+                    {"uid": "FRESH001", "team_id": str(free.id)},
+                    {"uid": "INTRUDER", "team_id": str(taken.id)},
+                ]
+            },
+        )
+        body = response.get_json()
+
+        assert body["summary"] == {"created": 1, "updated": 0, "skipped": 1}
+        assert body["errors"] == [{"row": 2, "detail": "Team already has a card"}]
+        assert RFIDCard.query.filter_by(competition_id=competition.id, uid="FRESH001").count() == 1
+
+    def test_rfid_import_resolves_team_names_case_insensitively(self, client, app):
+        admin = create_user(username="rfid-import-name-admin")
+        competition = create_competition(name="RFID Import Name Race")
+        other = create_competition(name="RFID Import Name Other Race")
+        add_membership(admin, competition, role="admin")
+        login_as(client, admin, competition)
+        team = create_team(competition, name="Red Foxes", number=1)
+        foreign = create_team(other, name="Blue Owls", number=1)
+
+        response = client.post(
+            "/api/rfid/import",
+            json={
+                "rows": [
+                    {"uid": "NAMED001", "team_name": "red foxes"},
+                    {"uid": "NAMED002", "team_name": "Blue Owls"},
+                    {"uid": "NAMED003", "team_id": str(foreign.id)},
+                ]
+            },
+        )
+        body = response.get_json()
+
+        assert body["summary"] == {"created": 1, "updated": 0, "skipped": 2}
+        assert [error["detail"] for error in body["errors"]] == ["Missing team_id or team_name", "Unknown team"]
+        assert RFIDCard.query.filter_by(uid="NAMED001").one().team_id == team.id
+
+    def test_rfid_import_reads_csv_upload(self, client, app):
+        admin = create_user(username="rfid-import-csv-admin")
+        competition = create_competition(name="RFID Import CSV Race")
+        add_membership(admin, competition, role="admin")
+        login_as(client, admin, competition)
+        team = create_team(competition, name="Csv Team", number=1)
+        upload = f"uid,team_id,number\r\nCSVCARD1,{team.id},4\r\n".encode()
+
+        response = client.post(
+            "/api/rfid/import",
+            data={"file": (io.BytesIO(upload), "cards.csv")},
+            content_type="multipart/form-data",
+        )
+
+        assert response.get_json()["summary"] == {"created": 1, "updated": 0, "skipped": 0}
+        assert RFIDCard.query.filter_by(uid="CSVCARD1").one().number == 4
+
+    def test_rfid_import_rejects_upload_over_content_limit_before_parsing(self, client, app, monkeypatch):
+        admin = create_user(username="rfid-import-limit-admin")
+        competition = create_competition(name="RFID Import Limit Race")
+        add_membership(admin, competition, role="admin")
+        login_as(client, admin, competition)
+        team = create_team(competition, name="Limit Team", number=1)
+        monkeypatch.setitem(app.config, "MAX_CONTENT_LENGTH", 1024)
+        upload = f"uid,team_id\r\nLIMITCARD,{team.id}\r\n".encode() + b"X" * 4096
+
+        response = client.post(
+            "/api/rfid/import",
+            data={"file": (io.BytesIO(upload), "cards.csv")},
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 413
+        assert response.get_json()["error"] == "payload_too_large"
+        assert RFIDCard.query.count() == 0
+
+
+class TestRfidCardList:
+    def test_rfid_card_list_revalidates_with_etag(self, client, app):
+        admin = create_user(username="rfid-etag-admin")
+        competition = create_competition(name="RFID ETag Race")
+        add_membership(admin, competition, role="admin")
+        login_as(client, admin, competition)
+        team = create_team(competition, name="ETag Team", number=1)
+        card = create_rfid_card(team, uid="ETAGCARD", number=1)
+
+        first = client.get("/api/rfid/cards")
+        etag = first.headers.get("ETag")
+        repeat = client.get("/api/rfid/cards", headers={"If-None-Match": etag})
+        card.number = 2
+        db.session.commit()
+        changed = client.get("/api/rfid/cards", headers={"If-None-Match": etag})
+
+        assert first.get_json()["cards"] == [
+            {"id": card.id, "uid": "ETAGCARD", "number": 1, "team": {"id": team.id, "name": "ETag Team", "number": 1}}
+        ]
+        assert repeat.status_code == 304
+        assert changed.status_code == 200
+        assert changed.get_json()["cards"][0]["number"] == 2
+
+    def test_rfid_card_list_gzips_for_clients_that_accept_it(self, client, app):
+        admin = create_user(username="rfid-gzip-admin")
+        competition = create_competition(name="RFID Gzip Race")
+        add_membership(admin, competition, role="admin")
+        login_as(client, admin, competition)
+        for number in range(1, 31):
+            team = create_team(competition, name=f"Gzip Team {number}", number=number)
+            create_rfid_card(team, uid=f"GZIPCARD{number:02d}", number=number)
+
+        plain = client.get("/api/rfid/cards")
+        zipped = client.get("/api/rfid/cards", headers={"Accept-Encoding": "gzip"})
+        repeat = client.get(
+            "/api/rfid/cards",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": zipped.headers["ETag"]},
+        )
+
+        assert "Content-Encoding" not in plain.headers
+        assert zipped.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in zipped.headers["Vary"]
+        assert json.loads(gzip.decompress(zipped.get_data())) == plain.get_json()
+        assert zipped.headers["ETag"] == f"W/{plain.headers['ETag']}"
+        assert repeat.status_code == 304
@@ -68,6 +68,23 @@ def test_patch_reorders_stops(client, app):
     assert [s["checkpoint_id"] for s in stops] == [cps[1].id, cps[0].id, cps[2].id]
 
 
+def test_patch_updates_stops_in_place(client, app):
+    """Kept positions reuse their rows; only the tail is added or dropped."""
+    comp, cps = _seed(client)
+    created = client.post(
+        "/api/paths", json={"name": "InPlace", "checkpoint_ids": [cps[0].id, cps[1].id, cps[2].id]}
+    ).get_json()["path"]
+    before = [stop.id for stop in db.session.get(Path, created["id"]).stops]
+
+    resp = client.patch(f"/api/paths/{created['id']}", json={"checkpoint_ids": [cps[0].id, cps[3].id]})
+    assert resp.status_code == 200
+    db.session.expire_all()
+    stops = db.session.get(Path, created["id"]).stops
+    assert [stop.id for stop in stops] == before[:2]
+    assert [stop.checkpoint_id for stop in stops] == [cps[0].id, cps[3].id]
+    assert [stop.position for stop in stops] == [0, 1]
+
+
 def test_duplicate_and_duplicate_reversed(client, app):
     comp, cps = _seed(client)
     created = client.post(
@@ -251,3 +268,12 @@ def test_checkpoint_side_removal_drops_stranded_segments(client, app):
     from app.models import TimedSegment
 
     assert TimedSegment.query.filter_by(path_id=path_id).count() == 0
+
+
+def test_checkpoint_summary_listing_returns_id_and_name(client, app):
+    """The path form's picker uses the lightweight id/name listing."""
+    comp, cps = _seed(client)
+    resp = client.get("/api/checkpoints?fields=summary")
+    assert resp.status_code == 200
+    rows = resp.get_json()["checkpoints"]
+    assert rows == [{"id": cp.id, "name": cp.name} for cp in sorted(cps, key=lambda cp: cp.name)]
@@ -0,0 +1,118 @@
+"""Anonymous leaderboard and stats views share a short-lived context cache.
+
+Pins:
+  - a repeat view inside PUBLIC_RESULTS_CACHE_SECONDS reuses the context
+  - a new check-in (or score entry) invalidates it straight away
+  - PUBLIC_RESULTS_CACHE_SECONDS = 0 turns the cache off
+  - a group id outside the competition reuses the all-groups entry
+  - the cached context holds plain group rows, not session-bound entities
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from app.blueprints.scores import routes as score_routes
+from app.extensions import db
+from app.models import CheckpointGroup
+from tests.support import create_checkin, create_checkpoint, create_competition, create_group, create_team
+
+
+@pytest.fixture
+def build_calls(monkeypatch):
+    calls = []
+    real_build = score_routes._build_scores_context
+
+    def _counting_build(*args, **kwargs):
+        calls.append(args)
+        return real_build(*args, **kwargs)
+
+    monkeypatch.setattr(score_routes, "_build_scores_context", _counting_build)
+    return calls
+
+
+@pytest.fixture
+def public_comp(app):
+    comp = create_competition(name="Cached Race")
+    comp.public_results = True
+    db.session.commit()
+    return comp
+
+
+def test_repeat_public_view_reuses_the_context_until_results_change(client, public_comp, build_calls):
+    url = f"/scores/public/{public_comp.id}"
+    team = create_team(public_comp, name="Cached Team", number=7)
+
+    first = client.get(url)
+    second = client.get(url)
+    assert first.status_code == second.status_code == 200
+    assert b"Cached Team" in second.data
+    assert len(build_calls) == 1
+
+    create_checkin(public_comp, team, create_checkpoint(public_comp, name="Cached CP"))
+    client.get(url)
+    cached = client.get(url)
+    assert len(build_calls) == 2
+    assert b"Cached CP" in cached.data
+
+    group = create_group(public_comp, name="Cached Group")
+    client.get(url, query_string={"group_id": group.id})
+    assert len(build_calls) == 3
+
+
+def test_unknown_group_id_shares_the_all_groups_entry(app, client, public_comp, build_calls):
+    url = f"/scores/public/{public_comp.id}"
+    other_group = create_group(create_competition(name="Other Race"), name="Elsewhere")
+
+    client.get(url)
+    for group_id in (999999, other_group.id):
+        assert client.get(url, query_string={"group_id": group_id}).status_code == 200
+
+    assert len(build_calls) == 1
+    assert list(app.extensions["public_scores_cache"]) == [(public_comp.id, None)]
+
+
+def test_public_results_cache_can_be_disabled(app, client, public_comp, build_calls):
+    app.config["PUBLIC_RESULTS_CACHE_SECONDS"] = 0
+    url = f"/scores/public/{public_comp.id}"
+
+    client.get(url)
+    client.get(url)
+
+    assert len(build_calls) == 2
+
+
+def test_public_stats_reuse_their_own_cached_context(client, public_comp, monkeypatch):
+    calls = []
+    real_build = score_routes._build_stats_context
+
+    def _counting_build(*args, **kwargs):
+        calls.append(args)
+        return real_build(*args, **kwargs)
+
+    monkeypatch.setattr(score_routes, "_build_stats_context", _counting_build)
+    url = f"/scores/public/{public_comp.id}/stats"
+
+    assert client.get(url).status_code == 200
+    assert client.get(url).status_code == 200
+    assert calls == [(public_comp.id,)]
+
+    team = create_team(public_comp, name="Stats Team", number=8)
+    create_checkin(public_comp, team, create_checkpoint(public_comp, name="Stats CP"))
+    client.get(url)
+    assert len(calls) == 2
+
+
+def test_cached_public_context_does_not_hold_group_entities(app, client, public_comp):
+    group = create_group(public_comp, name="Cached Group")
+    group_id = group.id
+    url = f"/scores/public/{public_comp.id}"
+
+    assert client.get(url).status_code == 200
+    db.session.remove()
+    cached = client.get(url)
+
+    assert b"Cached Group" in cached.data
+    context = app.extensions["public_scores_cache"][(public_comp.id, None)][2]
+    assert [(g.id, g.name) for g in context["groups"]] == [(group_id, "Cached Group")]
+    assert not any(isinstance(g, CheckpointGroup) for g in context["groups"])
@@ -0,0 +1,28 @@
+"""Verify the composite index behind the RFID card list.
+
+/api/rfid/cards filters on competition_id and orders by number (nulls
+last) then uid. The (competition_id, number, uid) index lets SQLite seek
+the competition and read cards already in order instead of sorting them.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import inspect, text
+
+from app.extensions import db
+from app.resources import rfid
+
+
+def test_rfid_cards_competition_number_uid_index_exists(app):
+    by_name = {ix["name"]: ix for ix in inspect(db.engine).get_indexes("rfid_cards")}
+    assert "ix_rfid_cards_competition_number_uid" in by_name, sorted(by_name)
+    assert by_name["ix_rfid_cards_competition_number_uid"]["column_names"] == ["competition_id", "number", "uid"]
+
+
+def test_rfid_card_list_query_uses_index_without_sort(app):
+    # The statement the route actually executes, with its bind filled in.
+    stmt = rfid._CARD_LIST.params(competition_id=1)
+    sql = str(stmt.compile(db.engine, compile_kwargs={"literal_binds": True}))
+    plan = [row[-1] for row in db.session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+    assert any("ix_rfid_cards_competition_number_uid" in step for step in plan), plan
+    assert not any("TEMP B-TREE" in step for step in plan), plan
@@ -22,6 +22,7 @@ field existence no longer depends on group-route links at all.
 
 from __future__ import annotations
 
+from app.extensions import db
 from app.models import ScoreField, ScoreFieldGroup
 from tests.support import (
     add_membership,
@@ -172,6 +173,27 @@ def test_group_matrix_disables_and_reenables_field_per_group(client, app):
     assert _resolved_keys(client, s["cp_shared"].id, s["g_beta"].id) == ["task1"]
 
 
+def test_setup_form_parses_rule_params_and_rejects_bad_json(client, app):
+    s = _seed(client)
+    field = create_score_field(s["cp_shared"], "task1", rule_type="multiplier", rule_params={"factor": 1})
+    form = {
+        "checkpoint_id": str(s["cp_shared"].id),
+        f"field_{field.id}_key": "task1",
+        f"field_{field.id}_rule_type": "multiplier",
+    }
+
+    resp = client.post("/scores/setup/fields", data={**form, f"field_{field.id}_rule_params": '{"factor": 2.5}'})
+    assert resp.status_code in (200, 302)
+    assert db.session.get(ScoreField, field.id).rule_params == {"factor": 2.5}
+
+    for bad in ('{"factor": ', "[1, 2]"):
+        resp = client.post("/scores/setup/fields", data={**form, f"field_{field.id}_rule_params": bad})
+        assert resp.status_code == 302
+        with client.session_transaction() as session:
+            assert any("Invalid rule params for task1" in msg for _cat, msg in session["_flashes"])
+        assert db.session.get(ScoreField, field.id).rule_params == {"factor": 2.5}
+
+
 def test_resolved_endpoint_returns_union_for_all_groups(client, app):
     """group_id=__all__ must hand back the union of every group's resolved
     field list so admin tooling can show one coherent field list."""
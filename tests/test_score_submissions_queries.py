@@ -0,0 +1,70 @@
+"""The submissions log loads each entry's team, checkpoint and judge with
+the entries themselves: its statement count must not grow with the
+number of distinct teams, checkpoints and judges on the page."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app.extensions import db
+from app.models import ScoreEntry, User
+from tests.support import add_membership, create_checkpoint, create_competition, create_team, create_user, login_as
+
+
+@contextmanager
+def _count_statements():
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _record)
+
+
+def _add_entries(comp, count: int) -> None:
+    for idx in range(count):
+        judge = create_user(username=f"sub-judge-{comp.id}-{idx}", role="judge")
+        team = create_team(comp, name=f"Sub team {comp.id}-{idx}", number=100 + idx)
+        checkpoint = create_checkpoint(comp, name=f"Sub CP {comp.id}-{idx}")
+        db.session.add(
+            ScoreEntry(
+                competition_id=comp.id,
+                team_id=team.id,
+                checkpoint_id=checkpoint.id,
+                judge_user_id=judge.id,
+                raw_fields={"points": idx},
+                total=float(idx),
+            )
+        )
+    db.session.commit()
+
+
+def _submissions_statement_count(client, admin_id: int, entry_count: int) -> int:
+    admin = db.session.get(User, admin_id)
+    comp = create_competition(name=f"Submissions {entry_count}")
+    add_membership(admin, comp, role="admin")
+    _add_entries(comp, entry_count)
+    login_as(client, admin, comp)
+    # Start from an empty identity map so related rows can't be served
+    # from objects the setup above left behind.
+    db.session.expunge_all()
+    with _count_statements() as statements:
+        resp = client.get("/scores/submissions")
+    assert resp.status_code == 200
+    assert f"Sub team {comp.id}-{entry_count - 1}".encode() in resp.data
+    return len(statements)
+
+
+def test_submissions_statement_count_does_not_grow_with_entries(client, app):
+    admin_id = create_user(username="subs-admin", role="admin").id
+
+    few = _submissions_statement_count(client, admin_id, 2)
+    many = _submissions_statement_count(client, admin_id, 8)
+
+    assert many == few
@@ -30,6 +30,7 @@ from app.resources.scores import (
 from app.utils.scoring import (
     compute_entry_total,
     compute_group_contrib,
+    compute_group_contribs,
     compute_segment_results,
     resolve_fields,
     resolve_group_segments,
@@ -697,6 +698,37 @@ class TestTimeline:
         result = compute_group_contrib(s["comp"].id, t.id, s["cat1"])
         assert result["time_points"] == 120.0
 
+    def test_batched_contribs_match_per_team_results(self, app, seeded):
+        s = seeded
+        teams = [s["teams"][name] for name in ("mGG-1", "mGG-2", "mGG-3", "mGG-4", "mGG-5")]
+        starts = {}
+        for team, minutes in zip(teams, (100, 130, 150, 250, None), strict=True):
+            starts[team.id] = _checkin(s["comp"], team, s["vcp"], 0)
+            _checkin(s["comp"], team, s["cp1"], 10)
+            if minutes is not None:
+                _checkin(s["comp"], team, s["cp5"], minutes)
+        db.session.add(
+            ScoreEntry(
+                competition_id=s["comp"].id,
+                checkin_id=starts[teams[2].id].id,
+                team_id=teams[2].id,
+                checkpoint_id=s["cp1"].id,
+                raw_fields={"dead_time": 30},
+                total=0,
+            )
+        )
+        db.session.commit()
+        self._set_race_rule(s["cat1"], threshold=120, dq_mult=2.0)
+        set_group_scoring(s["cat1"], found_points_per=5)
+
+        team_ids = [team.id for team in teams]
+        batched = compute_group_contribs(s["comp"].id, team_ids, s["cat1"])
+
+        assert batched == {tid: compute_group_contrib(s["comp"].id, tid, s["cat1"]) for tid in team_ids}
+        assert batched[teams[2].id]["time_points"] == 120.0
+        assert batched[teams[3].id]["auto_dnf"] is True
+        assert batched[teams[4].id]["time_points"] is None
+
     def test_timeline_minimum_zero_not_negative(self, app, seeded):
         s = seeded
         t = s["teams"]["mGG-1"]
@@ -1224,3 +1256,74 @@ class TestSegmentFormEdges:
         assert resp.status_code == 302, resp.data
         segment = TimedSegment.query.filter_by(path_id=path.id).one()
         assert segment.max_points == 0.0
+
+
+class TestStatsContext:
+    def test_group_stats_only_count_arrivals_on_the_group_route(self, app, seeded):
+        """Check-ins for every category come from one query; each category
+        must still see only its own physical route."""
+        from app.blueprints.scores.routes import _build_stats_context
+
+        s = seeded
+        off_route = create_checkpoint(s["comp"], name="Off route")
+        mgg, pp = s["teams"]["mGG-1"], s["teams"]["PP-1"]
+        _checkin(s["comp"], mgg, s["cp1"], 10)
+        _checkin(s["comp"], mgg, s["cp5"], 110)
+        _checkin(s["comp"], mgg, off_route, 50)
+        _checkin(s["comp"], pp, s["cp2"], 0)
+        _checkin(s["comp"], pp, s["cp5"], 60)
+
+        context = _build_stats_context(s["comp"].id)
+        stats = {g["name"]: g for g in context["groups"]}
+
+        assert stats["mGG"]["avg_checkpoint_count"] == pytest.approx(2 / 5)
+        assert stats["mGG"]["fastest_team"] == "mGG-1"
+        assert stats["mGG"]["fastest_minutes"] == pytest.approx(100.0)
+        assert stats["PP"]["fastest_team"] == "PP-1"
+        assert stats["PP"]["fastest_minutes"] == pytest.approx(60.0)
+        assert stats["RR+"]["avg_checkpoint_count"] == 0
+        assert [stats[name]["finished_count"] for name in ("mGG", "PP", "RR+")] == [1, 1, 0]
+        assert context["overall"]["median_time_minutes"] == pytest.approx(80.0)
+        assert context["overall"]["fastest_group"] == "PP"
+
+
+class TestLatestEntry:
+    def test_leaderboard_counts_only_the_newest_entry_per_checkpoint(self, app, seeded):
+        from app.blueprints.scores.routes import _build_scores_context
+
+        s = seeded
+        team = s["teams"]["mGG-1"]
+        for minutes, total in ((0, 40.0), (30, 15.0), (10, 90.0)):
+            db.session.add(
+                ScoreEntry(
+                    competition_id=s["comp"].id,
+                    team_id=team.id,
+                    checkpoint_id=s["cp3"].id,
+                    raw_fields={},
+                    total=total,
+                    created_at=T0 + timedelta(minutes=minutes),
+                )
+            )
+        db.session.commit()
+
+        context = _build_scores_context(s["comp"].id, s["cat1"].id)
+
+        row = next(r for r in context["rows"] if r["id"] == team.id)
+        assert context["per_team_points"][team.id] == {s["cp3"].id: 15.0}
+        assert row["total"] == 15.0
+
+    def test_leaderboard_dead_time_reads_both_field_spellings(self, app, seeded):
+        from app.blueprints.scores.routes import _build_scores_context
+
+        s = seeded
+        team = s["teams"]["mGG-2"]
+        for cp, raw in ((s["cp3"], {"dead_time": "7.5"}), (s["cp4"], {"Dead Time": 3}), (s["cp5"], {"x": 1})):
+            db.session.add(
+                ScoreEntry(competition_id=s["comp"].id, team_id=team.id, checkpoint_id=cp.id, raw_fields=raw, total=1)
+            )
+        db.session.commit()
+
+        context = _build_scores_context(s["comp"].id, s["cat1"].id)
+
+        row = next(r for r in context["rows"] if r["id"] == team.id)
+        assert row["dead_time"] == 10.5